@@ -15,6 +15,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data_structures import ActionType, Animal
 
+# Energy cost per action type, resolved once instead of per AnimalAction
+_ENERGY_COST_BY_ACTION = {
+    ActionType.MOVE_NORTH: 5.0,  # Movement costs energy
+    ActionType.MOVE_EAST: 5.0,
+    ActionType.MOVE_SOUTH: 5.0,
+    ActionType.MOVE_WEST: 5.0,
+    ActionType.ATTACK: 10.0,     # Attack costs more energy
+    ActionType.REST: 0.0,        # Rest costs no energy
+    ActionType.EAT: 2.0,         # Eat/Drink cost minimal energy
+    ActionType.DRINK: 2.0,
+}
+
 
 @dataclass
 class AnimalAction:
@@ -30,15 +42,7 @@ class AnimalAction:
     
     def __post_init__(self):
         """Calculate energy cost based on action type."""
-        if self.action_type in [ActionType.MOVE_NORTH, ActionType.MOVE_EAST, 
-                               ActionType.MOVE_SOUTH, ActionType.MOVE_WEST]:
-            self.energy_cost = 5.0  # Movement costs energy
-        elif self.action_type == ActionType.ATTACK:
-            self.energy_cost = 10.0  # Attack costs more energy
-        elif self.action_type == ActionType.REST:
-            self.energy_cost = 0.0  # Rest costs no energy
-        else:
-            self.energy_cost = 2.0  # Eat/Drink cost minimal energy
+        self.energy_cost = _ENERGY_COST_BY_ACTION.get(self.action_type, 2.0)
 
 
 class ActionPriority(Enum):
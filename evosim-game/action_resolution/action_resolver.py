@@ -5,7 +5,8 @@ This class orchestrates the 4-phase action resolution process.
 """
 
 from typing import Dict, List, Any
-from datetime import datetime
+from datetime import timedelta
+from time import perf_counter
 import logging
 
 # Import from parent directory
@@ -61,7 +62,7 @@ class ActionResolver:
         """
         self.logger.info("🎯 Starting Action Resolution System")
         
-        start_time = datetime.now()
+        start_time = perf_counter()
         living_animals = self.simulation.get_living_animals()
         
         if not living_animals:
@@ -73,7 +74,7 @@ class ActionResolver:
                 'phases_completed': 0,
                 'actions_processed': 0,
                 'casualties': 0,
-                'duration': datetime.now() - start_time
+                'duration': timedelta(seconds=perf_counter() - start_time)
             }
         
         try:
@@ -116,7 +117,7 @@ class ActionResolver:
                 'casualties': casualties,
                 'affected_animals': affected_animals,
                 'conflicts_resolved': execution_results['conflicts'],
-                'duration': datetime.now() - start_time,
+                'duration': timedelta(seconds=perf_counter() - start_time),
                 'phase_results': {
                     'decision': {'actions_collected': len(planned_actions)},
                     'status_environmental': status_results,
@@ -138,5 +139,5 @@ class ActionResolver:
                 'phases_completed': 0,
                 'actions_processed': 0,
                 'casualties': 0,
-                'duration': datetime.now() - start_time
+                'duration': timedelta(seconds=perf_counter() - start_time)
             }
@@ -70,10 +70,11 @@ class DecisionEngine:
         Kept intentionally to ensure robustness during partial integrations.
         """
         # Get current status
-        health = animal.status.get('Health', 100)
-        hunger = animal.status.get('Hunger', 100)
-        thirst = animal.status.get('Thirst', 100)
-        energy = animal.status.get('Energy', 100)
+        status = animal.status
+        health = status.get('Health', 100)
+        hunger = status.get('Hunger', 100)
+        thirst = status.get('Thirst', 100)
+        energy = status.get('Energy', 100)
         
         # Priority 1: Critical survival needs
         if health <= 20:
@@ -105,7 +106,7 @@ class DecisionEngine:
                 if (0 <= tx < self.simulation.world.dimensions[0] and
                     0 <= ty < self.simulation.world.dimensions[1]):
                     tile = self.simulation.world.get_tile(tx, ty)
-                    if tile and tile.terrain_type.value == 'Water':
+                    if tile and tile._terrain_str == 'Water':
                         return AnimalAction(animal.animal_id, animal, ActionType.DRINK, target_location=(wx, wy))
         
         # Priority 2: Energy management
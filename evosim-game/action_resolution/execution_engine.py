@@ -84,7 +84,7 @@ class ExecutionEngine:
             animal = action.animal
             
             # Check if animal is still alive
-            if animal not in self.simulation.get_living_animals():
+            if not self.simulation.is_living(animal):
                 action.success = False
                 action.result_message = "Animal died before action execution"
                 return False
@@ -118,16 +118,17 @@ class ExecutionEngine:
     def _execute_rest_action(self, action: AnimalAction) -> bool:
         """Execute rest action - restore energy and health."""
         animal = action.animal
+        status = animal.status
         
         # Restore energy
-        current_energy = animal.status.get('Energy', 100)
+        current_energy = status.get('Energy', 100)
         energy_restored = min(20, 100 - current_energy)
-        animal.status['Energy'] = current_energy + energy_restored
+        status['Energy'] = current_energy + energy_restored
         
         # Restore small amount of health
-        current_health = animal.status.get('Health', 100)
+        current_health = status.get('Health', 100)
         health_restored = min(5, 100 - current_health)
-        animal.status['Health'] = current_health + health_restored
+        status['Health'] = current_health + health_restored
         
         action.success = True
         action.result_message = f"Rested: +{energy_restored} energy, +{health_restored} health"
@@ -178,7 +179,8 @@ class ExecutionEngine:
             return False
         
         # Consume energy for the action
-        animal.status['Energy'] = max(0, animal.status.get('Energy', 100) - action.energy_cost)
+        status = animal.status
+        status['Energy'] = max(0, status.get('Energy', 100) - action.energy_cost)
         
         # Restore hunger based on food type
         hunger_restored = 0
@@ -188,8 +190,8 @@ class ExecutionEngine:
             hunger_restored = 40 if animal.category == AnimalCategory.CARNIVORE else 20
         
         # Apply hunger restoration
-        current_hunger = animal.status.get('Hunger', 100)
-        animal.status['Hunger'] = min(100, current_hunger + hunger_restored)
+        current_hunger = status.get('Hunger', 100)
+        status['Hunger'] = min(100, current_hunger + hunger_restored)
         # Fitness: count food units consumed as resource
         add_resource_units(animal, float(hunger_restored))
         
@@ -259,12 +261,13 @@ class ExecutionEngine:
                 return False
         
         # Consume energy for the action
-        animal.status['Energy'] = max(0, animal.status.get('Energy', 100) - action.energy_cost)
+        status = animal.status
+        status['Energy'] = max(0, status.get('Energy', 100) - action.energy_cost)
         
         # Restore thirst
         thirst_restored = 50
-        current_thirst = animal.status.get('Thirst', 100)
-        animal.status['Thirst'] = min(100, current_thirst + thirst_restored)
+        current_thirst = status.get('Thirst', 100)
+        status['Thirst'] = min(100, current_thirst + thirst_restored)
         # Fitness: count water units as resource
         add_resource_units(animal, float(thirst_restored))
         
@@ -320,13 +323,14 @@ class ExecutionEngine:
         
         if random.random() < hit_chance:
             damage = random.randint(15, 25) + (attacker_strength - 50) // 10
-            target.status['Health'] = max(0, target.status.get('Health', 100) - damage)
+            target_health = max(0, target.status.get('Health', 100) - damage)
+            target.status['Health'] = target_health
             
             action.success = True
             action.result_message = f"Attack hit for {damage} damage"
             
             # Check if target died
-            if target.status['Health'] <= 0:
+            if target_health <= 0:
                 self.logger.info(f"Animal {target.animal_id} killed by {animal.animal_id}")
                 self.simulation.remove_animal(target)
                 tile.occupant = animal  # Attacker takes the tile
@@ -383,7 +387,7 @@ class ExecutionEngine:
                 
                 # Fail other actions
                 for action in actions:
-                    if action != winner:
+                    if action is not winner:
                         action.success = False
                         action.result_message = "Lost movement conflict (lower agility)"
                         results['failed'] += 1
@@ -395,19 +399,12 @@ class ExecutionEngine:
         if not conflicting_actions:
             return None
         
-        # Sort by agility (highest first)
+        # Highest agility wins; a single max() scan keeps the first contender on ties
         def get_agi(animal):
             return animal.traits.get('AGI') or animal.traits.get('Agility', 50)
-        sorted_actions = sorted(
-            conflicting_actions,
-            key=lambda a: get_agi(a.animal),
-            reverse=True
-        )
-        
-        winner = sorted_actions[0]
-        winner_agility = winner.animal.traits.get('AGI') or winner.animal.traits.get('Agility', 50)
+        winner = max(conflicting_actions, key=lambda a: get_agi(a.animal))
         
-        self.logger.debug(f"Movement conflict resolved: {winner.animal_id} wins with {winner_agility} agility")
+        self.logger.debug(f"Movement conflict resolved: {winner.animal_id} wins with {get_agi(winner.animal)} agility")
         
         return winner
     
@@ -418,7 +415,7 @@ class ExecutionEngine:
             target_x, target_y = action.target_location
             
             # Check if animal is still alive
-            if animal not in self.simulation.get_living_animals():
+            if not self.simulation.is_living(animal):
                 action.success = False
                 action.result_message = "Animal died before movement"
                 return False
@@ -467,7 +464,7 @@ class ExecutionEngine:
             animal.status['Energy'] = max(0, animal.status.get('Energy', 100) - action.energy_cost)
             
             # Update locations
-            animal.location = (target_x, target_y)
+            self.simulation.move_animal(animal, (target_x, target_y))
             # Fitness: distance traveled
             add_distance(animal, 1.0)
             
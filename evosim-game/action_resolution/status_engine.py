@@ -16,6 +16,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data_structures import Animal, Simulation, EffectType
 from fitness import increment_time
 
+# Health lost per turn for each debuff, keyed by effect name
+_DEBUFF_HEALTH_LOSS = {
+    EffectType.POISONED.value: 5,
+    EffectType.INJURED.value: 3,
+}
+
 
 class StatusEngine:
     """
@@ -47,59 +53,57 @@ class StatusEngine:
         }
         
         animals_to_remove = []
+        hunger_depletion = thirst_depletion = health_loss_count = energy_regeneration = 0
+        processed = 0
         
         for animal in living_animals:
             try:
+                status = animal.status
                 # Count time survived (per action resolution cycle)
                 increment_time(animal, 1)
                 # Apply hunger depletion
-                current_hunger = animal.status.get('Hunger', 100)
-                new_hunger = max(0, current_hunger - 3)  # Lose 3 hunger per turn
-                animal.status['Hunger'] = new_hunger
-                if current_hunger != new_hunger:
-                    results['hunger_depletion'] += 1
+                current_hunger = status.get('Hunger', 100)
+                hunger = max(0, current_hunger - 3)  # Lose 3 hunger per turn
+                status['Hunger'] = hunger
+                if current_hunger != hunger:
+                    hunger_depletion += 1
                 
                 # Apply thirst depletion
-                current_thirst = animal.status.get('Thirst', 100)
-                new_thirst = max(0, current_thirst - 2)  # Lose 2 thirst per turn
-                animal.status['Thirst'] = new_thirst
-                if current_thirst != new_thirst:
-                    results['thirst_depletion'] += 1
+                current_thirst = status.get('Thirst', 100)
+                thirst = max(0, current_thirst - 2)  # Lose 2 thirst per turn
+                status['Thirst'] = thirst
+                if current_thirst != thirst:
+                    thirst_depletion += 1
                 
                 # Apply health loss from debuffs
                 health_loss = 0
                 for effect in animal.active_effects:
-                    if effect.name == EffectType.POISONED.value:
-                        health_loss += 5
-                    elif effect.name == EffectType.INJURED.value:
-                        health_loss += 3
+                    health_loss += _DEBUFF_HEALTH_LOSS.get(effect.name, 0)
                 
+                health = status.get('Health', 100)
                 if health_loss > 0:
-                    current_health = animal.status.get('Health', 100)
-                    new_health = max(0, current_health - health_loss)
-                    animal.status['Health'] = new_health
-                    results['health_loss'] += 1
+                    health = max(0, health - health_loss)
+                    status['Health'] = health
+                    health_loss_count += 1
                 
                 # Apply passive energy regeneration (if resting or healthy)
-                current_energy = animal.status.get('Energy', 100)
+                current_energy = status.get('Energy', 100)
                 if current_energy < 100:
-                    energy_regen = 2 if animal.status.get('Health', 100) > 50 else 1
+                    energy_regen = 2 if health > 50 else 1
                     new_energy = min(100, current_energy + energy_regen)
-                    animal.status['Energy'] = new_energy
+                    status['Energy'] = new_energy
                     if current_energy != new_energy:
-                        results['energy_regeneration'] += 1
+                        energy_regeneration += 1
                 
                 # Check for death conditions
-                if (animal.status.get('Health', 100) <= 0 or 
-                    animal.status.get('Hunger', 100) <= 0 or 
-                    animal.status.get('Thirst', 100) <= 0):
+                if health <= 0 or hunger <= 0 or thirst <= 0:
                     
                     death_cause = []
-                    if animal.status.get('Health', 100) <= 0:
+                    if health <= 0:
                         death_cause.append("health")
-                    if animal.status.get('Hunger', 100) <= 0:
+                    if hunger <= 0:
                         death_cause.append("starvation")
-                    if animal.status.get('Thirst', 100) <= 0:
+                    if thirst <= 0:
                         death_cause.append("dehydration")
                     
                     self.logger.info(f"Animal {animal.animal_id} died from {', '.join(death_cause)}")
@@ -109,11 +113,17 @@ class StatusEngine:
                         'cause': ', '.join(death_cause)
                     })
                 
-                results['animals_processed'] += 1
+                processed += 1
                 
             except Exception as e:
                 self.logger.warning(f"Status phase failed for animal {animal.animal_id}: {e}")
         
+        results['animals_processed'] = processed
+        results['hunger_depletion'] = hunger_depletion
+        results['thirst_depletion'] = thirst_depletion
+        results['health_loss'] = health_loss_count
+        results['energy_regeneration'] = energy_regeneration
+        
         # Remove dead animals
         for animal in animals_to_remove:
             self.simulation.remove_animal(animal)
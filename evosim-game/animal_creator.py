@@ -8,7 +8,9 @@ Reference: Section V - Parameters and Variables, Section VII - Preparations Stag
 """
 
 import random
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -45,14 +47,20 @@ class TrainingQuestionData:
 class AnimalCreator:
     """Handles animal creation and customization."""
     
-    def __init__(self, seed: Optional[int] = None):
+    # The training questions are static, so they are built once and shared read-only
+    _TRAINING_QUESTIONS: Optional[Mapping[TrainingQuestion, TrainingQuestionData]] = None
+    
+    def __init__(self, seed: Optional[int] = None, rng: Optional[random.Random] = None):
         """Initialize the animal creator with optional seed for reproducible results.
         
         Args:
             seed: Optional random seed for reproducible animal generation
+            rng: Optional caller-owned generator to draw from instead (seed is then ignored)
         """
-        self.random = random.Random(seed)
-        self.training_questions = self._create_training_questions()
+        self.random = rng or random.Random(seed)
+        if AnimalCreator._TRAINING_QUESTIONS is None:
+            AnimalCreator._TRAINING_QUESTIONS = MappingProxyType(self._create_training_questions())
+        self.training_questions = AnimalCreator._TRAINING_QUESTIONS
     
     def _create_training_questions(self) -> Dict[TrainingQuestion, TrainingQuestionData]:
         """Create the training questions for animal customization.
@@ -228,7 +236,7 @@ class AnimalCreator:
             raise ValueError(f"Expected {len(TrainingQuestion)} training choices, got {len(training_choices)}")
         
         # Create base animal
-        animal = create_random_animal(animal_id, category)
+        animal = create_random_animal(animal_id, category, self.random)
         
         # Apply training bonuses
         trait_bonuses = self._calculate_training_bonuses(training_choices)
@@ -244,14 +252,26 @@ class AnimalCreator:
         Args:
             training_choices: List of integers (0-3) representing question answers
             
+        Returns:
+            Dictionary mapping trait names to their total bonus values
+        """
+        return dict(self._bonuses_for_choices(tuple(training_choices)))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _bonuses_for_choices(training_choices: Tuple[int, ...]) -> Dict[str, int]:
+        """Cached core of _calculate_training_bonuses (callers must not mutate the result).
+        
+        Args:
+            training_choices: Tuple of integers (0-3) representing question answers
+            
         Returns:
             Dictionary mapping trait names to their total bonus values
         """
         bonuses = {trait: 0 for trait in constants.TRAIT_NAMES}
         
-        for i, choice in enumerate(training_choices):
-            question_type = list(TrainingQuestion)[i]
-            question_data = self.training_questions[question_type]
+        for question_type, choice in zip(TrainingQuestion, training_choices):
+            question_data = AnimalCreator._TRAINING_QUESTIONS[question_type]
             
             if 0 <= choice < len(question_data.options):
                 trait = question_data.options[choice].trait_bonus
@@ -308,7 +328,7 @@ class AnimalCreator:
         self._validate_custom_traits(custom_traits)
         
         # Create base animal
-        animal = create_random_animal(animal_id, category)
+        animal = create_random_animal(animal_id, category, self.random)
         
         # Apply custom traits
         for trait, value in custom_traits.items():
@@ -335,12 +355,15 @@ class AnimalCreator:
         Raises:
             ValueError: If traits are invalid, missing, or out of range
         """
-        # Check for invalid trait names
-        for trait in traits:
-            if trait not in constants.TRAIT_NAMES:
-                raise ValueError(f"Invalid trait: {trait}")
-        
-        # Check for missing required traits
+        # Check names with a set operation; only walk the keys to report an error.
+        # Read TRAIT_NAMES on each call: ConfigManager.apply_constants may replace it.
+        trait_names = frozenset(constants.TRAIT_NAMES)
+        if not traits.keys() <= trait_names:
+            invalid = next(trait for trait in traits if trait not in trait_names)
+            raise ValueError(f"Invalid trait: {invalid}")
+        
+        # Presence and value are checked per trait, in TRAIT_NAMES order, so a bad
+        # value on an earlier trait is reported before a later missing one
         for trait in constants.TRAIT_NAMES:
             if trait not in traits:
                 raise ValueError(f"Missing required trait: {trait}")
@@ -355,7 +378,8 @@ class AnimalCreator:
     def create_population_with_training(
         self,
         population_size: int,
-        training_choices: List[List[int]]
+        training_choices: List[List[int]],
+        categories: Optional[List[AnimalCategory]] = None
     ) -> List[Animal]:
         """Create a population of animals with individual training choices.
         
@@ -365,18 +389,23 @@ class AnimalCreator:
         Args:
             population_size: Number of animals to create
             training_choices: List of training choice lists, one per animal
+            categories: Optional category order to cycle through instead of
+                the default AnimalCategory order
             
         Returns:
             List of trained animals
             
         Raises:
-            ValueError: If training_choices length doesn't match population_size
+            ValueError: If training_choices length doesn't match population_size,
+                or categories is given but empty
         """
         if len(training_choices) != population_size:
             raise ValueError(f"Expected {population_size} training choice sets, got {len(training_choices)}")
+        if categories is not None and not categories:
+            raise ValueError("Categories must not be empty")
         
         animals = []
-        categories = list(AnimalCategory)
+        categories = list(categories) if categories is not None else list(AnimalCategory)
         
         for i in range(population_size):
             category = categories[i % len(categories)]
@@ -411,7 +440,7 @@ class AnimalCreator:
             animal_id = f"diverse_{i:03d}"
             
             # Create base animal
-            animal = create_random_animal(animal_id, category)
+            animal = create_random_animal(animal_id, category, self.random)
             
             # Add some random variation
             if self.random.random() < diversity_factor:
@@ -454,14 +483,14 @@ class AnimalCreator:
         animal.status['Health'] = float(max_health)
         animal.status['Energy'] = float(max_energy)
     
-    def get_training_questions(self) -> Dict[TrainingQuestion, TrainingQuestionData]:
+    def get_training_questions(self) -> Mapping[TrainingQuestion, TrainingQuestionData]:
         """Get the training questions for display or interactive use.
         
         Returns the complete set of training questions that can be used
         for user interfaces or programmatic animal creation.
         
         Returns:
-            Dictionary mapping question types to their data and options
+            Read-only mapping of question types to their data and options
         """
         return self.training_questions
     
@@ -500,9 +529,7 @@ class AnimalCreator:
         specialization = "High" if trait_balance >= 3 else "Medium" if trait_balance >= 2 else "Low"
         
         # Calculate effective stats
-        effective_traits = {}
-        for trait in constants.TRAIT_NAMES:
-            effective_traits[trait] = animal.get_effective_trait(trait)
+        effective_traits = animal.get_effective_traits()
         
         return {
             'total_traits': total_traits,
@@ -515,17 +542,63 @@ class AnimalCreator:
             'max_energy': animal.get_max_energy()
         }
 
+    def analyze_population(self, animals: List[Animal]) -> Dict[str, List]:
+        """Analyze trait distribution for a whole population in one pass.
+
+        Column-oriented counterpart of analyze_animal_traits for bulk callers
+        (dashboards, generation reports): each key maps to a list with one
+        entry per animal, in input order, matching the per-animal analysis.
+
+        Args:
+            animals: Animals to analyze
+
+        Returns:
+            Dictionary of parallel lists:
+            - total_traits: Sum of all trait values
+            - primary_trait: Highest trait name
+            - primary_value: Value of highest trait
+            - trait_balance: Difference between highest and lowest traits
+            - specialization: Specialization level (High/Medium/Low)
+        """
+        totals: List[int] = []
+        primaries: List[str] = []
+        primary_values: List[int] = []
+        balances: List[int] = []
+        specializations: List[str] = []
+
+        for animal in animals:
+            traits = animal.traits
+            primary_trait = max(traits, key=traits.get)
+            primary_value = traits[primary_trait]
+            trait_balance = primary_value - min(traits.values())
+            totals.append(sum(traits.values()))
+            primaries.append(primary_trait)
+            primary_values.append(primary_value)
+            balances.append(trait_balance)
+            specializations.append(
+                "High" if trait_balance >= 3 else "Medium" if trait_balance >= 2 else "Low"
+            )
+
+        return {
+            'total_traits': totals,
+            'primary_trait': primaries,
+            'primary_value': primary_values,
+            'trait_balance': balances,
+            'specialization': specializations,
+        }
+
 
 class AnimalCustomizer:
     """Handles advanced animal customization and trait optimization."""
     
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, rng: Optional[random.Random] = None):
         """Initialize the animal customizer with optional seed for reproducible results.
         
         Args:
             seed: Optional random seed for reproducible animal generation
+            rng: Optional caller-owned generator to draw from instead (seed is then ignored)
         """
-        self.random = random.Random(seed)
+        self.random = rng or random.Random(seed)
     
     def optimize_animal_for_category(self, animal: Animal) -> Animal:
         """Optimize an animal's traits for its category's primary focus.
@@ -598,8 +671,9 @@ class AnimalCustomizer:
                 base_points += 1
             traits[trait] = max(constants.STANDARD_TRAIT_MIN, base_points)
         
-        # Create animal with custom traits
-        creator = AnimalCreator()
+        # Create animal with custom traits; the creator (and so the brain) shares this
+        # customizer's generator so a seeded customizer yields repeatable animals
+        creator = AnimalCreator(rng=self.random)
         return creator.create_animal_with_custom_traits(animal_id, category, traits)
     
     def create_specialized_animal(
@@ -636,7 +710,7 @@ class AnimalCustomizer:
             raise ValueError(f"Specialization level cannot exceed {constants.PRIMARY_TRAIT_MAX}, got {specialization_level}")
         
         # Create base animal
-        animal = create_random_animal(animal_id, category)
+        animal = create_random_animal(animal_id, category, self.random)
         
         # Set specialization trait
         animal.traits[specialization_trait] = specialization_level
@@ -12,6 +12,7 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass, field, asdict
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
 
 import constants as constants_module
@@ -33,6 +34,9 @@ class SimulationConfig:
     log_level: str = "INFO"
     random_seed: Optional[int] = None
     world_config: Optional[Any] = None  # GenerationConfig from world_generator
+    retain_events: bool = True  # False keeps only the most recent events per generation
+    fresh_world_each_generation: bool = False  # False reuses terrain and only refreshes resources
+    output_dir: Optional[str] = None  # CSV report directory; None uses evosim-game/demo/runs
 
     def __post_init__(self) -> None:
         if self.max_weeks <= 0:
@@ -282,9 +286,9 @@ class ConfigGUI:
                     continue
                 val = getattr(constants_module, key)
                 ttk.Label(inner, text=key).grid(row=row, column=0, sticky=tk.W, padx=6, pady=6)
-                if isinstance(val, (dict, list)):
+                if isinstance(val, (dict, list, tuple, MappingProxyType)):
                     txt = tk.Text(inner, height=5, width=50)
-                    txt.insert("1.0", json.dumps(val, indent=2))
+                    txt.insert("1.0", json.dumps(val, indent=2, default=dict))
                     txt.grid(row=row, column=1, sticky=tk.EW, padx=6, pady=6)
                     self._dict_texts[f"constants.{key}"] = txt
                 else:
@@ -366,7 +370,7 @@ class ConfigGUI:
             effective = cfg.constants_overrides.get(const_name, getattr(constants_module, const_name, {}))
             try:
                 txt.delete("1.0", tk.END)
-                txt.insert("1.0", json.dumps(effective, indent=2))
+                txt.insert("1.0", json.dumps(effective, indent=2, default=dict))
             except Exception:
                 txt.delete("1.0", tk.END)
                 txt.insert("1.0", str(effective))
@@ -443,7 +447,7 @@ class ConfigGUI:
         if isinstance(value, (int, float, str)):
             return str(value)
         try:
-            return json.dumps(value)
+            return json.dumps(value, default=dict)
         except Exception:
             return str(value)
 
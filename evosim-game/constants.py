@@ -7,6 +7,8 @@ All magic numbers and configuration values are defined here for easy tuning and
 Reference: Section IX - Code Implementation Constants from documentation.md
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # Game Parameters
 # =============================================================================
@@ -23,26 +25,26 @@ GRID_WIDTH = 25
 GRID_HEIGHT = 25
 
 # Terrain distribution percentages
-TERRAIN_DISTRIBUTION = {
+TERRAIN_DISTRIBUTION = MappingProxyType({
     'Plains': 0.55,
     'Forest': 0.20,
     'Jungle': 0.05,
     'Swamp': 0.05,
     'Water': 0.10,
     'Mountains': 0.05
-}
+})
 
 # Resource spawn probabilities
 FOOD_SPAWN_CHANCE = 0.15
 WATER_SPAWN_CHANCE = 0.05
 
 # Terrain movement cost multipliers
-TERRAIN_MOVEMENT_MODIFIERS = {
+TERRAIN_MOVEMENT_MODIFIERS = MappingProxyType({
     'Plains': 1.0,
     'Forest': 1.5,
     'Jungle': 2.0,
     'Swamp': 1.8
-}
+})
 
 # Swamp-specific effects
 SWAMP_SICKNESS_CHANCE = 0.10
@@ -165,95 +167,95 @@ WINTER_DEPLETION_MULTIPLIER = 2
 # =============================================================================
 
 # Weights for fitness score calculation
-FITNESS_WEIGHTS = {
+FITNESS_WEIGHTS = MappingProxyType({
     'Time': 1,
     'Resource': 5,
     'Kill': 50,
     'Distance': 0.2,
     'Event': 10
-}
+})
 
 # =============================================================================
 # ANIMAL CATEGORIES
 # =============================================================================
 
 # Available animal categories
-ANIMAL_CATEGORIES = ['Herbivore', 'Carnivore', 'Omnivore']
+ANIMAL_CATEGORIES = ('Herbivore', 'Carnivore', 'Omnivore')
 
 # Primary traits for each category
-CATEGORY_PRIMARY_TRAITS = {
+CATEGORY_PRIMARY_TRAITS = MappingProxyType({
     'Herbivore': 'AGI',
     'Carnivore': 'STR',
     'Omnivore': 'END'
-}
+})
 
 # =============================================================================
 # TRAIT NAMES
 # =============================================================================
 
 # Core trait names
-TRAIT_NAMES = ['STR', 'AGI', 'INT', 'END', 'PER']
+TRAIT_NAMES = ('STR', 'AGI', 'INT', 'END', 'PER')
 
 # =============================================================================
 # STATUS NAMES
 # =============================================================================
 
 # Core status names
-STATUS_NAMES = ['Health', 'Hunger', 'Thirst', 'Energy', 'Instinct']
+STATUS_NAMES = ('Health', 'Hunger', 'Thirst', 'Energy', 'Instinct')
 
 # =============================================================================
 # TERRAIN TYPES
 # =============================================================================
 
 # Available terrain types
-TERRAIN_TYPES = ['Plains', 'Forest', 'Jungle', 'Water', 'Swamp', 'Mountains']
+TERRAIN_TYPES = ('Plains', 'Forest', 'Jungle', 'Water', 'Swamp', 'Mountains')
 
 # =============================================================================
 # RESOURCE TYPES
 # =============================================================================
 
 # Available resource types
-RESOURCE_TYPES = ['Plant', 'Prey', 'Water', 'Carcass']
+RESOURCE_TYPES = ('Plant', 'Prey', 'Water', 'Carcass')
 
 # =============================================================================
 # EFFECT NAMES
 # =============================================================================
 
 # Buff effects
-BUFF_EFFECTS = ['Well-Fed', 'Hydrated', 'Rested', 'Adrenaline Rush']
+BUFF_EFFECTS = ('Well-Fed', 'Hydrated', 'Rested', 'Adrenaline Rush')
 
 # Debuff effects
-DEBUFF_EFFECTS = ['Injured', 'Poisoned', 'Exhausted', 'Sick']
+DEBUFF_EFFECTS = ('Injured', 'Poisoned', 'Exhausted', 'Sick')
 
 # =============================================================================
 # EVENT TYPES
 # =============================================================================
 
 # Triggered events
-TRIGGERED_EVENTS = [
+TRIGGERED_EVENTS = (
     'Animal Encounter',
     'Resource Scarcity',
     'Sudden Threat',
     'Curious Object'
-]
+)
 
 # Random events
-RANDOM_EVENTS = [
+RANDOM_EVENTS = (
     'Migration',
     'Resource Bloom',
     'Drought',
     'Predator Frenzy',
     'Grazing Season'
-]
+)
 
 # Disasters
-DISASTERS = [
+DISASTERS = (
     'Wildfire',
     'Contamination',
     'Flood',
     'Earthquake',
     'Harsh Winter'
-]
+)
 
 # =============================================================================
 # SIMULATION PARAMETERS
@@ -293,7 +295,7 @@ OUTPUT_ACTIVATION = 'softmax'
 # =============================================================================
 
 # Available actions for animals
-ACTIONS = [
+ACTIONS = (
     'Move North',
     'Move East', 
     'Move South',
@@ -302,7 +304,7 @@ ACTIONS = [
     'Eat',
     'Drink',
     'Attack'
-]
+)
 
 # =============================================================================
 # DEBUGGING AND LOGGING
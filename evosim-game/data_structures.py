@@ -7,6 +7,7 @@ These classes represent the fundamental entities in the game world.
 Reference: Section XI - Conceptual Data Structure from documentation.md
 """
 
+from array import array
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -36,6 +37,13 @@ class TerrainType(Enum):
     MOUNTAINS = "Mountains"
 
 
+# Compact terrain codes (declaration order) used by World.terrain_array
+_TERRAIN_CODES = {terrain: i for i, terrain in enumerate(TerrainType)}
+
+# Orthogonal neighbour offsets (W, E, N, S) used by World.get_adjacent_tiles
+_ADJACENT_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
 class ResourceType(Enum):
     """Resource types available in the world."""
     PLANT = "Plant"
@@ -72,7 +80,7 @@ class ActionType(Enum):
 # CORE DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Effect:
     """Represents a temporary effect (buff or debuff) applied to an animal."""
     name: str
@@ -96,7 +104,7 @@ class Effect:
             self.duration -= 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """Represents a resource that can be consumed by animals."""
     resource_type: ResourceType
@@ -123,13 +131,14 @@ class Resource:
         return self.uses_left <= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Represents a single tile in the world grid."""
     coordinates: Tuple[int, int]
     terrain_type: TerrainType
     resource: Optional[Resource] = None
     occupant: Optional['Animal'] = None
+    _terrain_str: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate tile data after initialization."""
@@ -137,6 +146,9 @@ class Tile:
             raise ValueError(f"Coordinates must be a tuple of 2 integers, got {self.coordinates}")
         if not all(isinstance(coord, int) and coord >= 0 for coord in self.coordinates):
             raise ValueError(f"Coordinates must be non-negative integers, got {self.coordinates}")
+        
+        # Cache the terrain name so stats walks skip the Enum.value lookup
+        self._terrain_str = self.terrain_type.value
     
     def is_occupied(self) -> bool:
         """Check if the tile is occupied by an animal."""
@@ -148,7 +160,7 @@ class Tile:
     
     def get_movement_cost(self) -> float:
         """Get the movement cost multiplier for this terrain."""
-        return constants.TERRAIN_MOVEMENT_MODIFIERS.get(self.terrain_type.value, 1.0)
+        return constants.TERRAIN_MOVEMENT_MODIFIERS.get(self._terrain_str, 1.0)
 
 
 @dataclass
@@ -174,17 +186,44 @@ class World:
         """Check if coordinates are within world bounds."""
         return 0 <= x < self.dimensions[0] and 0 <= y < self.dimensions[1]
     
+    def coordinates_within(self, center: Tuple[int, int], radius: float) -> List[Tuple[int, int]]:
+        """Get all in-bounds coordinates within a Euclidean radius of center."""
+        cx, cy = center
+        reach = int(radius)
+        r_sq = radius * radius
+        width, height = self.dimensions
+        return [
+            (x, y)
+            for x in range(max(0, cx - reach), min(width, cx + reach + 1))
+            for y in range(max(0, cy - reach), min(height, cy + reach + 1))
+            if (x - cx) ** 2 + (y - cy) ** 2 <= r_sq
+        ]
+    
+    def terrain_array(self) -> array:
+        """
+        Get terrain as a flat, row-major array of TerrainType indices.
+        
+        Tile (x, y) is at index y * width + x; codes follow TerrainType declaration order.
+        """
+        codes = _TERRAIN_CODES
+        return array('B', [codes[tile.terrain_type] for row in self.grid for tile in row])
+    
+    def terrain_equals(self, other: 'World') -> bool:
+        """Check whether two worlds have the same dimensions and terrain layout."""
+        return self.dimensions == other.dimensions and self.terrain_array() == other.terrain_array()
+    
     def get_adjacent_tiles(self, x: int, y: int) -> List[Tile]:
         """Get all valid adjacent tiles."""
-        adjacent = []
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_x, new_y = x + dx, y + dy
-            if self.is_valid_coordinate(new_x, new_y):
-                adjacent.append(self.get_tile(new_x, new_y))
-        return adjacent
+        width, height = self.dimensions
+        grid = self.grid
+        return [
+            grid[y + dy][x + dx]
+            for dx, dy in _ADJACENT_OFFSETS
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Animal:
     """Represents an animal in the simulation."""
     animal_id: str
@@ -196,6 +235,7 @@ class Animal:
     location: Tuple[int, int] = (0, 0)
     fitness_score_components: Dict[str, float] = field(default_factory=dict)
     mlp_network: Optional[Any] = None  # Will be set when MLP is implemented
+    _category_str: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate animal data after initialization."""
@@ -235,6 +275,9 @@ class Animal:
         if self.category not in AnimalCategory:
             raise ValueError(f"Invalid animal category: {self.category}")
         
+        # Cache the category name so per-animal walks skip the Enum.value lookup
+        self._category_str = self.category.value
+        
         # Derive passive from category if not provided
         if not self.passive:
             category_to_passive = {
@@ -269,6 +312,15 @@ class Animal:
         
         return max(1, base_value)  # Ensure minimum value of 1
     
+    def get_effective_traits(self) -> Dict[str, int]:
+        """Get effective values for all traits with a single pass over active effects."""
+        effective = dict(self.traits)
+        for effect in self.active_effects:
+            for trait_name, modifier in effect.modifiers.items():
+                if trait_name in effective:
+                    effective[trait_name] += modifier
+        return {trait_name: max(1, value) for trait_name, value in effective.items()}
+    
     def add_effect(self, effect: Effect) -> None:
         """Add an effect to the animal."""
         self.active_effects.append(effect)
@@ -283,7 +335,7 @@ class Animal:
             effect.tick()
         
         # Remove expired effects
-        self.active_effects = [e for e in self.active_effects if not e.is_expired()]
+        self.active_effects = [e for e in self.active_effects if e.duration > 0]
     
     def is_alive(self) -> bool:
         """Check if the animal is still alive."""
@@ -315,29 +367,106 @@ class Simulation:
     world: Optional[World] = None
     population: List[Animal] = field(default_factory=list)
     graveyard: List[Animal] = field(default_factory=list)
+    # Animals still in the population, keyed by identity (Animal is unhashable)
+    _living: Dict[int, Animal] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Location -> living animals, rebuilt lazily after animals move, spawn or die
+    _spatial_index: Optional[Dict[Tuple[int, int], List[Animal]]] = field(default=None, init=False, repr=False, compare=False)
+    # Cached get_living_animals() result, dropped whenever an animal is added or removed
+    _living_cache: Optional[List[Animal]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate simulation data after initialization."""
         if self.current_week < 0:
             raise ValueError(f"Current week must be non-negative, got {self.current_week}")
+        self._living = {id(animal): animal for animal in self.population}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore from pickle or deepcopy, re-keying the identity index for the new objects."""
+        self.__dict__.update(state)
+        self._living = {id(animal): animal for animal in self.population}
+        self._spatial_index = None
+        self._living_cache = None
+    
+    @property
+    def living_count(self) -> int:
+        """Number of living animals (same set as get_living_animals and is_living)."""
+        return len(self._living)
     
     def add_animal(self, animal: Animal) -> None:
         """Add an animal to the population."""
         self.population.append(animal)
+        self._living[id(animal)] = animal
+        self._spatial_index = None
+        self._living_cache = None
     
     def remove_animal(self, animal: Animal) -> None:
         """Remove an animal from the population and add to graveyard."""
-        if animal in self.population:
-            self.population.remove(animal)
-            self.graveyard.append(animal)
+        in_index = self._living.pop(id(animal), None) is not None
+        for i, member in enumerate(self.population):
+            if member is animal:
+                del self.population[i]
+                break
+        else:
+            # Not in the population at all (e.g. already in the graveyard)
+            if not in_index:
+                return
+        self._spatial_index = None
+        self._living_cache = None
+        self.graveyard.append(animal)
+    
+    def is_living(self, animal: Animal) -> bool:
+        """Check whether this exact animal is in the living population (O(1))."""
+        return id(animal) in self._living
+    
+    def on_animal_died(self, animal: Animal) -> None:
+        """Hook for engines when an animal's health reaches 0."""
+        self.remove_animal(animal)
     
     def get_living_animals(self) -> List[Animal]:
-        """Get all living animals in the population."""
-        return [animal for animal in self.population if animal.is_alive()]
+        """Get all living animals in the population.
+        
+        Membership in the living set is the single source of truth: engines that
+        drop an animal's health to 0 must call on_animal_died (or remove_animal)
+        before the phase ends. The list is cached until the next add/remove, so
+        callers must not mutate it (the simulation is single-threaded, so no
+        locking is needed).
+        """
+        if self._living_cache is None:
+            self._living_cache = list(self._living.values())
+        return self._living_cache
     
     def get_dead_animals(self) -> List[Animal]:
         """Get all dead animals in the population."""
-        return [animal for animal in self.population if not animal.is_alive()]
+        return [animal for animal in self._living.values() if animal.status['Health'] <= 0]
+    
+    def move_animal(self, animal: Animal, location: Tuple[int, int]) -> None:
+        """Relocate an animal and drop the spatial index so neighbor queries see the move."""
+        animal.location = location
+        self._spatial_index = None
+    
+    def invalidate_spatial_index(self) -> None:
+        """Mark animal locations as changed so the next neighbor query rebuilds."""
+        self._spatial_index = None
+    
+    def neighbors_within(self, pos: Tuple[int, int], radius: float) -> List[Animal]:
+        """Get living animals within a Euclidean radius of pos."""
+        if self._spatial_index is None:
+            index: Dict[Tuple[int, int], List[Animal]] = {}
+            for animal in self._living.values():
+                index.setdefault(animal.location, []).append(animal)
+            self._spatial_index = index
+        
+        px, py = pos
+        reach = int(radius)
+        r_sq = radius * radius
+        found = []
+        index = self._spatial_index
+        for x in range(px - reach, px + reach + 1):
+            for y in range(py - reach, py + reach + 1):
+                bucket = index.get((x, y))
+                if bucket and (x - px) ** 2 + (y - py) ** 2 <= r_sq:
+                    found.extend(bucket)
+        return found
     
     def advance_week(self) -> None:
         """Advance the simulation by one week."""
@@ -349,24 +478,54 @@ class Simulation:
         self.event_queue.clear()
         self.population.clear()
         self.graveyard.clear()
+        self._living.clear()
+        self._spatial_index = None
+        self._living_cache = None
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def create_random_animal(animal_id: str, category: AnimalCategory) -> Animal:
-    """Create a random animal with appropriate trait distribution."""
+_PASSIVE_ABILITIES = {
+    AnimalCategory.HERBIVORE: "Efficient Grazer",
+    AnimalCategory.CARNIVORE: "Ambush Predator",
+    AnimalCategory.OMNIVORE: "Iron Stomach"
+}
+
+# Trait modifiers per effect, stored as item tuples; create_effect copies them into a fresh dict
+_EFFECT_MODIFIERS = {
+    EffectType.WELL_FED: (('STR', 1), ('END', 1)),
+    EffectType.HYDRATED: (('AGI', 1),),
+    EffectType.RESTED: (),  # Handled separately in energy regeneration
+    EffectType.ADRENALINE_RUSH: (('STR', 2), ('AGI', 2)),
+    EffectType.INJURED: (('AGI', -2),),
+    EffectType.POISONED: (),  # Handled separately in damage calculation
+    EffectType.EXHAUSTED: (),  # Handled separately in energy regeneration
+    EffectType.SICK: (('STR', -1), ('AGI', -1), ('INT', -1), ('END', -1), ('PER', -1))
+}
+
+
+def create_random_animal(animal_id: str, category: AnimalCategory,
+                         rng: Optional[random.Random] = None) -> Animal:
+    """
+    Create a random animal with appropriate trait distribution.
+    
+    Traits and brain weights are drawn from rng when given, so a caller's seeded
+    generator covers the whole animal; otherwise traits use the module-level
+    random functions and the brain gets its own generator.
+    """
     # Get primary trait for category
     primary_trait = constants.CATEGORY_PRIMARY_TRAITS[category.value]
     
-    # Generate traits
-    traits = {}
-    for trait in constants.TRAIT_NAMES:
-        if trait == primary_trait:
-            traits[trait] = random.randint(constants.PRIMARY_TRAIT_MIN, constants.PRIMARY_TRAIT_MAX)
-        else:
-            traits[trait] = random.randint(constants.STANDARD_TRAIT_MIN, constants.STANDARD_TRAIT_MAX)
+    # Generate traits (one randint per trait name, in TRAIT_NAMES order)
+    randint = (rng or random).randint
+    primary_range = (constants.PRIMARY_TRAIT_MIN, constants.PRIMARY_TRAIT_MAX)
+    standard_range = (constants.STANDARD_TRAIT_MIN, constants.STANDARD_TRAIT_MAX)
+    traits = {
+        trait: randint(*(primary_range if trait == primary_trait else standard_range))
+        for trait in constants.TRAIT_NAMES
+    }
     
     # Generate initial status
     max_health = constants.BASE_HEALTH + (traits['END'] * constants.HEALTH_PER_ENDURANCE)
@@ -380,24 +539,17 @@ def create_random_animal(animal_id: str, category: AnimalCategory) -> Animal:
         'Instinct': 0.0  # 0 for Calm, 1 for Alert
     }
     
-    # Get passive ability
-    passive_abilities = {
-        AnimalCategory.HERBIVORE: "Efficient Grazer",
-        AnimalCategory.CARNIVORE: "Ambush Predator",
-        AnimalCategory.OMNIVORE: "Iron Stomach"
-    }
-    
     animal = Animal(
         animal_id=animal_id,
         category=category,
         traits=traits,
         status=status,
-        passive=passive_abilities[category],
+        passive=_PASSIVE_ABILITIES[category],
         location=(0, 0)  # Will be set during world generation
     )
 
     # Attach a freshly initialized MLP brain (no behavioral integration yet)
-    animal.mlp_network = MLPNetwork()
+    animal.mlp_network = MLPNetwork(rng=rng)
     return animal
 
 
@@ -406,22 +558,10 @@ def create_effect(effect_type: EffectType, duration: int = None) -> Effect:
     if duration is None:
         duration = constants.DEFAULT_BUFF_DURATION if effect_type.value in constants.BUFF_EFFECTS else constants.DEFAULT_DEBUFF_DURATION
     
-    # Define effect modifiers
-    modifiers = {
-        EffectType.WELL_FED: {'STR': 1, 'END': 1},
-        EffectType.HYDRATED: {'AGI': 1},
-        EffectType.RESTED: {},  # Handled separately in energy regeneration
-        EffectType.ADRENALINE_RUSH: {'STR': 2, 'AGI': 2},
-        EffectType.INJURED: {'AGI': -2},
-        EffectType.POISONED: {},  # Handled separately in damage calculation
-        EffectType.EXHAUSTED: {},  # Handled separately in energy regeneration
-        EffectType.SICK: {'STR': -1, 'AGI': -1, 'INT': -1, 'END': -1, 'PER': -1}
-    }
-    
     return Effect(
         name=effect_type.value,
         duration=duration,
-        modifiers=modifiers.get(effect_type, {})
+        modifiers=dict(_EFFECT_MODIFIERS.get(effect_type, ()))
     )
 
 
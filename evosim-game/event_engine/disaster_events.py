@@ -45,17 +45,8 @@ class DisasterEvent(Event):
                 random.randint(0, world_height - 1)
             )
         
-        affected_tiles = set()
-        epicenter_x, epicenter_y = self.epicenter
-        
-        # Calculate tiles within radius
-        for x in range(simulation.world.dimensions[0]):
-            for y in range(simulation.world.dimensions[1]):
-                distance = math.sqrt((x - epicenter_x) ** 2 + (y - epicenter_y) ** 2)
-                if distance <= self.area_of_effect:
-                    affected_tiles.add((x, y))
-        
-        return affected_tiles
+        # Calculate tiles within radius (only the epicenter's bounding box can qualify)
+        return set(simulation.world.coordinates_within(self.epicenter, self.area_of_effect))
     
     def get_severity_multiplier(self) -> float:
         """Get damage multiplier based on severity."""
@@ -259,9 +250,7 @@ class EarthquakeEvent(DisasterEvent):
         effects_applied = 0
         
         # Find animals in affected area
-        for animal in simulation.get_living_animals():
-            if animal.location in affected_area:
-                affected_animals.append(animal)
+        affected_animals.extend(simulation.neighbors_within(self.epicenter, self.area_of_effect))
         
         # Apply earthquake effects to animals
         for animal in affected_animals:
@@ -345,9 +334,7 @@ class WildfireEvent(DisasterEvent):
         effects_applied = 0
         
         # Find animals in affected area
-        for animal in simulation.get_living_animals():
-            if animal.location in affected_area:
-                affected_animals.append(animal)
+        affected_animals.extend(simulation.neighbors_within(self.epicenter, self.area_of_effect))
         
         # Apply fire effects to animals
         for animal in affected_animals:
@@ -424,9 +411,7 @@ class FloodEvent(DisasterEvent):
         effects_applied = 0
         
         # Find animals in affected area
-        for animal in simulation.get_living_animals():
-            if animal.location in affected_area:
-                affected_animals.append(animal)
+        affected_animals.extend(simulation.neighbors_within(self.epicenter, self.area_of_effect))
         
         # Apply flood effects to animals
         for animal in affected_animals:
@@ -494,9 +479,7 @@ class DroughtEvent(DisasterEvent):
         effects_applied = 0
         
         # Find animals in affected area
-        for animal in simulation.get_living_animals():
-            if animal.location in affected_area:
-                affected_animals.append(animal)
+        affected_animals.extend(simulation.neighbors_within(self.epicenter, self.area_of_effect))
         
         # Apply drought effects to animals (dehydration)
         for animal in affected_animals:
@@ -512,6 +495,8 @@ class DroughtEvent(DisasterEvent):
                 health_loss = random.randint(5, 15)
                 current_health = animal.status.get('Health', 100)
                 animal.status['Health'] = max(0, current_health - health_loss)
+                if animal.status['Health'] <= 0:
+                    simulation.on_animal_died(animal)
             
             effects_applied += 1
         
@@ -565,9 +550,7 @@ class ToxicSpillEvent(DisasterEvent):
         effects_applied = 0
         
         # Find animals in affected area
-        for animal in simulation.get_living_animals():
-            if animal.location in affected_area:
-                affected_animals.append(animal)
+        affected_animals.extend(simulation.neighbors_within(self.epicenter, self.area_of_effect))
         
         # Apply toxic effects to animals
         for animal in affected_animals:
@@ -693,9 +676,7 @@ class PredatorInvasionEvent(DisasterEvent):
         effects_applied = 0
         
         # Find animals in affected area
-        for animal in simulation.get_living_animals():
-            if animal.location in affected_area:
-                affected_animals.append(animal)
+        affected_animals.extend(simulation.neighbors_within(self.epicenter, self.area_of_effect))
         
         if not affected_animals:
             return EventResult(
@@ -7,7 +7,7 @@ and provides a unified interface for the simulation controller.
 
 from typing import List, Dict, Any, Optional
 import logging
-from datetime import datetime
+from time import perf_counter
 
 # Import from parent directory
 import sys
@@ -71,7 +71,7 @@ class EventEngine:
             }
         
         self.current_week = week
-        start_time = datetime.now()
+        start_time = perf_counter()
         
         try:
             # Execute events through scheduler
@@ -81,7 +81,7 @@ class EventEngine:
             self._update_statistics(event_results)
             
             # Calculate execution time
-            execution_time = datetime.now() - start_time
+            execution_time = perf_counter() - start_time
             
             # Prepare result summary
             successful_events = [r for r in event_results if r.success]
@@ -99,7 +99,7 @@ class EventEngine:
                 "message": self._generate_summary_message(event_results),
                 "casualties": total_casualties,
                 "resources_affected": total_resources_affected,
-                "execution_time": execution_time.total_seconds(),
+                "execution_time": execution_time,
                 "results": event_results,
                 "statistics": self.get_statistics()
             }
@@ -116,7 +116,7 @@ class EventEngine:
                 "message": f"Event engine error: {str(e)}",
                 "results": [],
                 "statistics": {},
-                "execution_time": (datetime.now() - start_time).total_seconds()
+                "execution_time": perf_counter() - start_time
             }
     
     def _update_statistics(self, event_results: List[EventResult]):
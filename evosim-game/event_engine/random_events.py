@@ -407,7 +407,7 @@ class MigrationEvent(RandomEvent):
                 new_x, new_y = new_location
                 new_tile = simulation.world.get_tile(new_x, new_y)
                 if new_tile:
-                    animal.location = new_location
+                    simulation.move_animal(animal, new_location)
                     new_tile.occupant = animal
                     migrated_count += 1
         
@@ -49,13 +49,10 @@ def one_point_crossover(params_a: List[float], params_b: List[float], rng: rando
 
 def mutate(params: List[float], rng: random.Random, rate: float = None, sigma: float = 0.02) -> List[float]:
     r = constants.MUTATION_RATE if rate is None else rate
-    out = []
-    for p in params:
-        if rng.random() < r:
-            out.append(p + rng.gauss(0.0, sigma))
-        else:
-            out.append(p)
-    return out
+    # Bound methods hoisted out of the loop; draw order is unchanged so seeded runs match
+    draw = rng.random
+    gauss = rng.gauss
+    return [p + gauss(0.0, sigma) if draw() < r else p for p in params]
 
 
 def evolve_population(parent_population: List[Animal], rng: random.Random | None = None) -> List[Animal]:
@@ -77,7 +74,7 @@ def evolve_population(parent_population: List[Animal], rng: random.Random | None
     next_gen: List[Animal] = []
     for i in range(elite_count):
         parent = sorted_parents[i]
-        child = create_random_animal(f"elite_{i}_{parent.animal_id}", parent.category)
+        child = create_random_animal(f"elite_{i}_{parent.animal_id}", parent.category, rnd)
         _set_brain_from_flat(child, _flatten_brain(parent))
         next_gen.append(child)
 
@@ -87,7 +84,7 @@ def evolve_population(parent_population: List[Animal], rng: random.Random | None
 
         # Child inherits category randomly from a parent for now (could be strategy-specific)
         child_category = rnd.choice([p1.category, p2.category])
-        child = create_random_animal(f"child_{len(next_gen)}", child_category)
+        child = create_random_animal(f"child_{len(next_gen)}", child_category, rnd)
 
         w1 = _flatten_brain(p1)
         w2 = _flatten_brain(p2)
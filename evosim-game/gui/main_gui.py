@@ -405,7 +405,9 @@ class EvoSimGUI:
                 world_config=world_config
             )
             
-            # Create simulation controller
+            # Create simulation controller (closing any previous one's report writer)
+            if self.simulation_controller:
+                self.simulation_controller.close()
             self.simulation_controller = SimulationController(config)
             
             # Initialize world and population
@@ -476,6 +478,8 @@ class EvoSimGUI:
     def reset_simulation(self):
         """Reset the simulation."""
         self.stop_simulation()
+        if self.simulation_controller:
+            self.simulation_controller.close()
         self.simulation_controller = None
         self.current_generation = 0
         self.current_week = 0
@@ -971,11 +975,12 @@ Version: 1.0.0
     def on_closing(self):
         """Handle window closing."""
         if self.is_running:
-            if messagebox.askokcancel("Quit", "Simulation is running. Do you want to quit?"):
-                self.stop_simulation()
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askokcancel("Quit", "Simulation is running. Do you want to quit?"):
+                return
+            self.stop_simulation()
+        if self.simulation_controller:
+            self.simulation_controller.close()
+        self.root.destroy()
     
     def run(self):
         """Run the GUI application."""
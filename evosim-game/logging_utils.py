@@ -7,19 +7,37 @@ for later analysis (fitness, traits, categories, outcomes).
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List
+from operator import itemgetter
 import csv
+import io
 import os
 import statistics
 
 from data_structures import Animal
 
 
+# Reports are appended in one batch per call; a large buffer keeps that to a few syscalls
+CSV_WRITE_BUFFER = 1 << 20
+
+POPULATION_FIELDNAMES = [
+    'generation','animal_id','category','fitness','time','resource','kill','distance','event',
+    'health','hunger','thirst','energy','STR','AGI','INT','END','PER'
+]
+
+GENERATION_FIELDNAMES = [
+    'generation','count','avg_fitness','max_fitness','max_fitness_id',
+    'avg_fitness_herbivore','avg_fitness_carnivore','avg_fitness_omnivore'
+]
+
+_population_row = itemgetter(*POPULATION_FIELDNAMES[1:])
+
+
 def summarize_animal(animal: Animal) -> Dict[str, Any]:
     comp = animal.fitness_score_components or {}
     return {
         'animal_id': animal.animal_id,
-        'category': animal.category.value,
+        'category': animal._category_str,
         'health': animal.status.get('Health', 0),
         'hunger': animal.status.get('Hunger', 0),
         'thirst': animal.status.get('Thirst', 0),
@@ -55,42 +73,60 @@ TERRAIN_COLORS = {
 }
 
 
-def write_population_csv(path: str, generation_index: int, animals: List[Animal]) -> str:
+def format_population_csv(generation_index: int, animals: Iterable[Animal]) -> str:
+    """Render population rows (no header) as CSV text for a later append."""
+    buf = io.StringIO()
+    csv.writer(buf).writerows(
+        (generation_index,) + _population_row(summarize_animal(a)) for a in animals
+    )
+    return buf.getvalue()
+
+
+def format_generation_summary_csv(summary: Dict[str, Any]) -> str:
+    """Render one generation summary row (no header) as CSV text."""
+    buf = io.StringIO()
+    csv.DictWriter(buf, fieldnames=GENERATION_FIELDNAMES).writerow(summary)
+    return buf.getvalue()
+
+
+def append_csv_text(path: str, fieldnames: List[str], text: str) -> str:
+    """Append pre-rendered CSV text, writing the header first if the file is new."""
     # Ensure directory exists
     dir_path = os.path.dirname(path)
     if dir_path:  # Only create directory if there is one
         os.makedirs(dir_path, exist_ok=True)
-    fieldnames = [
-        'generation','animal_id','category','fitness','time','resource','kill','distance','event',
-        'health','hunger','thirst','energy','STR','AGI','INT','END','PER'
-    ]
     write_header = not os.path.exists(path)
-    with open(path, 'a', newline='') as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
+    with open(path, 'a', newline='', buffering=CSV_WRITE_BUFFER) as f:
         if write_header:
-            w.writeheader()
-        for a in animals:
-            row = summarize_animal(a)
-            row['generation'] = generation_index
-            w.writerow(row)
+            csv.writer(f).writerow(fieldnames)
+        f.write(text)
     return path
 
 
+def write_population_csv(path: str, generation_index: int, animals: List[Animal]) -> str:
+    return append_csv_text(path, POPULATION_FIELDNAMES, format_population_csv(generation_index, animals))
+
 
-def compute_generation_summary(generation_index: int, animals: List[Animal]) -> Dict[str, Any]:
+def compute_generation_summary(generation_index: int, animals: Iterable[Animal]) -> Dict[str, Any]:
     """Compute high-level KPIs for a generation from final animal states."""
-    fitnesses = [a.get_fitness_score() for a in animals]
+    fitnesses: List[float] = []
     by_cat: Dict[str, List[float]] = {'Herbivore': [], 'Carnivore': [], 'Omnivore': []}
+    best = None
+    best_fitness = 0.0
+    # Single pass: each animal's fitness is scored once
     for a in animals:
-        by_cat[a.category.value].append(a.get_fitness_score())
+        fitness = a.get_fitness_score()
+        fitnesses.append(fitness)
+        by_cat[a._category_str].append(fitness)
+        if best is None or fitness > best_fitness:
+            best, best_fitness = a, fitness
     def avg(lst: List[float]) -> float:
         return float(statistics.mean(lst)) if lst else 0.0
-    best = max(animals, key=lambda a: a.get_fitness_score()) if animals else None
     return {
         'generation': generation_index,
-        'count': len(animals),
+        'count': len(fitnesses),
         'avg_fitness': avg(fitnesses),
-        'max_fitness': best.get_fitness_score() if best else 0.0,
+        'max_fitness': best_fitness,
         'max_fitness_id': best.animal_id if best else '',
         'avg_fitness_herbivore': avg(by_cat['Herbivore']),
         'avg_fitness_carnivore': avg(by_cat['Carnivore']),
@@ -100,19 +136,4 @@ def compute_generation_summary(generation_index: int, animals: List[Animal]) ->
 
 def write_generation_summary_csv(path: str, summary: Dict[str, Any]) -> str:
     """Append one summary row to a generations.csv file."""
-    # Ensure directory exists
-    dir_path = os.path.dirname(path)
-    if dir_path:  # Only create directory if there is one
-        os.makedirs(dir_path, exist_ok=True)
-    fieldnames = [
-        'generation','count','avg_fitness','max_fitness','max_fitness_id',
-        'avg_fitness_herbivore','avg_fitness_carnivore','avg_fitness_omnivore'
-    ]
-    write_header = not os.path.exists(path)
-    with open(path, 'a', newline='') as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        if write_header:
-            w.writeheader()
-        w.writerow(summary)
-    return path
-
+    return append_csv_text(path, GENERATION_FIELDNAMES, format_generation_summary_csv(summary))
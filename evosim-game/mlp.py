@@ -7,6 +7,8 @@ Architecture and activations are driven by values from constants.py.
 
 from __future__ import annotations
 
+from itertools import chain
+from operator import mul
 from typing import List, Sequence
 import math
 import random
@@ -18,6 +20,11 @@ def _relu(x: float) -> float:
     return x if x > 0.0 else 0.0
 
 
+def _dense(W: Sequence[Sequence[float]], b: Sequence[float], x: Sequence[float]) -> List[float]:
+    """Affine layer W @ x + b with W stored as [out_dim][in_dim]."""
+    return [sum(map(mul, wi, x), bi) for wi, bi in zip(W, b)]
+
+
 def _softmax(z: Sequence[float]) -> List[float]:
     if not z:
         return []
@@ -57,8 +64,10 @@ class MLPNetwork:
         self.rng = rng or random.Random()
 
         # Initialize weights with small random values (He/Xavier-like simple scaling)
+        uniform = self.rng.uniform
+
         def init_matrix(rows: int, cols: int, scale: float) -> List[List[float]]:
-            return [[self.rng.uniform(-scale, scale) for _ in range(cols)] for _ in range(rows)]
+            return [[uniform(-scale, scale) for _ in range(cols)] for _ in range(rows)]
 
         # Layer shapes: W shape is [out_dim][in_dim]
         self.W1 = init_matrix(self.hidden1_nodes, self.input_nodes, scale=0.1)
@@ -79,50 +88,22 @@ class MLPNetwork:
         if len(x) != self.input_nodes:
             raise ValueError(f"Input length {len(x)} does not match expected {self.input_nodes}")
 
-        # Layer 1
-        h1: List[float] = []
-        for i in range(self.hidden1_nodes):
-            s = self.b1[i]
-            wi = self.W1[i]
-            # dot product
-            for j in range(self.input_nodes):
-                s += wi[j] * x[j]
-            h1.append(_relu(s))
-
-        # Layer 2
-        h2: List[float] = []
-        for i in range(self.hidden2_nodes):
-            s = self.b2[i]
-            wi = self.W2[i]
-            for j in range(self.hidden1_nodes):
-                s += wi[j] * h1[j]
-            h2.append(_relu(s))
-
-        # Output
-        logits: List[float] = []
-        for i in range(self.output_nodes):
-            s = self.b3[i]
-            wi = self.W3[i]
-            for j in range(self.hidden2_nodes):
-                s += wi[j] * h2[j]
-            logits.append(s)
+        # Each row is one C-level multiply-accumulate; starting sum() at the bias keeps
+        # the original b + w0*x0 + w1*x1 + ... addition order
+        h1 = [_relu(s) for s in _dense(self.W1, self.b1, x)]
+        h2 = [_relu(s) for s in _dense(self.W2, self.b2, h1)]
+        logits = _dense(self.W3, self.b3, h2)
 
         return _softmax(logits)
 
     # --- Optional utilities for EA integration ---
     def get_parameters_flat(self) -> List[float]:
         """Flatten all weights and biases to a single list."""
-        flat: List[float] = []
-        for row in self.W1:
-            flat.extend(row)
-        flat.extend(self.b1)
-        for row in self.W2:
-            flat.extend(row)
-        flat.extend(self.b2)
-        for row in self.W3:
-            flat.extend(row)
-        flat.extend(self.b3)
-        return flat
+        return list(chain(
+            chain.from_iterable(self.W1), self.b1,
+            chain.from_iterable(self.W2), self.b2,
+            chain.from_iterable(self.W3), self.b3,
+        ))
 
     def set_parameters_flat(self, params: Sequence[float]) -> None:
         """
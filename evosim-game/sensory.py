@@ -80,11 +80,12 @@ def build_input_vector(sim: Simulation, animal: Animal) -> List[float]:
     v: List[float] = []
 
     # ---- Internal signals (normalized 0..1) ----
-    health = _clamp01(animal.status.get('Health', 0) / max(animal.get_max_health(), 1))
-    hunger = _clamp01(animal.status.get('Hunger', 0) / 100.0)
-    thirst = _clamp01(animal.status.get('Thirst', 0) / 100.0)
-    energy = _clamp01(animal.status.get('Energy', 0) / max(animal.get_max_energy(), 1))
-    instinct = _clamp01(animal.status.get('Instinct', 0))
+    status = animal.status
+    health = _clamp01(status.get('Health', 0) / max(animal.get_max_health(), 1))
+    hunger = _clamp01(status.get('Hunger', 0) / 100.0)
+    thirst = _clamp01(status.get('Thirst', 0) / 100.0)
+    energy = _clamp01(status.get('Energy', 0) / max(animal.get_max_energy(), 1))
+    instinct = _clamp01(status.get('Instinct', 0))
     v.extend([health, hunger, thirst, energy, instinct])
 
     # ---- 3x3 directional sampling within vision ----
@@ -146,7 +147,7 @@ def _tile_features(tile: Optional[Tile], viewer: Animal) -> List[float]:
     terrain_names = constants.TERRAIN_TYPES
     terrain_idx = 0
     try:
-        terrain_idx = terrain_names.index(tile.terrain_type.value)
+        terrain_idx = terrain_names.index(tile._terrain_str)
     except Exception:
         terrain_idx = 0
     terrain_norm = _norm_index(terrain_idx, len(terrain_names))
@@ -9,14 +9,20 @@ Reference: Section XI - Conceptual Data Structure from documentation.md
 """
 
 import os
+from array import array
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 from typing import Dict, List, Optional, Tuple, Any, Union
 import random
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 from data_structures import (
     Simulation, World, Animal, Effect,
-    AnimalCategory, TerrainType, EffectType, ActionType
+    AnimalCategory, TerrainType, ResourceType, EffectType, ActionType
 )
 from world_generator import WorldGenerator, GenerationConfig
 from animal_creator import AnimalCreator, AnimalCustomizer
@@ -28,14 +34,37 @@ from action_resolution import ActionResolver
 from event_engine import EventEngine
 from evolution import evolve_population
 from logging_utils import (
-    write_population_csv,
+    POPULATION_FIELDNAMES,
+    GENERATION_FIELDNAMES,
+    format_population_csv,
+    format_generation_summary_csv,
+    append_csv_text,
     compute_generation_summary,
-    write_generation_summary_csv,
 )
 
 # Centralized configuration
 from config import SimulationConfig
 
+# Default reporting output directory (SimulationConfig.output_dir overrides it)
+_OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'demo', 'runs')
+
+# Events kept per generation when SimulationConfig.retain_events is False
+_EVENT_HISTORY_LIMIT = 1024
+
+# Week 1 always runs this fixed event order; later weeks are randomized
+_WEEK1_SCHEDULE = (
+    'movement',
+    'triggered_event',
+    'random_event',
+    'disaster',
+    'triggered_event',
+    'movement',
+    'triggered_event'
+)
+
+# Event results carry their 'timestamp' as raw wall-clock nanoseconds; see timestamp_to_iso
+_ts = time.time_ns
+
 
 class SimulationController:
     """
@@ -57,15 +86,22 @@ class SimulationController:
             config: Simulation configuration. If None, uses default values.
         """
         self.config = config or SimulationConfig()
+        # Controller-owned randomness (terrain, animals and their brains, placement,
+        # schedules, evolution) all derives from this stream, so equal seeds replay a run
+        self.rng = random.Random(self.config.random_seed)
         self.simulation = Simulation()
         self.world_generator = WorldGenerator(self.config.world_config)
-        self.animal_creator = AnimalCreator()
-        self.animal_customizer = AnimalCustomizer()
+        # Generator for the configured (or default) world, reused by initialize_world()
+        # whenever no explicit GenerationConfig is passed
+        self._default_world_generator = self.world_generator
+        self.animal_creator = AnimalCreator(rng=self.rng)
+        self.animal_customizer = AnimalCustomizer(rng=self.rng)
         
         # Setup logging
         self._setup_logging()
         
-        # Set random seed if specified
+        # The action and event engines still draw from the module-level random
+        # functions, so the global seed is kept for them
         if self.config.random_seed is not None:
             random.seed(self.config.random_seed)
             self.logger.info(f"Random seed set to: {self.config.random_seed}")
@@ -81,11 +117,23 @@ class SimulationController:
         self.generation_stats = []
         self.weekly_stats = []
         
-        # Initialize action resolver (lazy initialization)
-        self._action_resolver = None
+        # Initialize action resolver and event engine (both bound to self.simulation)
+        self._action_resolver = ActionResolver(self.simulation, self.logger)
+        self._event_engine = EventEngine(self.simulation, self.logger)
         
-        # Initialize event engine (lazy initialization)
-        self._event_engine = None
+        # Per-generation event schedules, indexed by week - 1
+        self._event_schedules: List[List[str]] = []
+        
+        # Single background writer so CSV reporting does not block the next generation
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evosim-report")
+        
+        # Event type -> handler, built once for the weekly event loop
+        self._event_dispatch = {
+            'movement': self._execute_movement_event,
+            'triggered_event': self._execute_triggered_event,
+            'random_event': self._execute_random_event,
+            'disaster': self._execute_disaster_event
+        }
         
         self.logger.info("Simulation controller initialized")
     
@@ -95,9 +143,13 @@ class SimulationController:
         
         # Create logger
         self.logger = logging.getLogger(f"EvoSim_{id(self)}")
+        if not self.config.enable_logging:
+            # No console handler and no INFO/DEBUG chatter, but warnings and
+            # errors still propagate to whatever the application configured
+            log_level = max(log_level, logging.WARNING)
         self.logger.setLevel(log_level)
-        
-        if not self.logger.handlers:
+
+        if self.config.enable_logging and not self.logger.handlers:
             # Create console handler
             console_handler = logging.StreamHandler()
             console_handler.setLevel(log_level)
@@ -127,14 +179,15 @@ class SimulationController:
         try:
             self.logger.info("Initializing world...")
             
-            # Use provided config or default
-            config = world_config or self.config.world_config or GenerationConfig()
-            
-            # Create world generator with the config
-            world_generator = WorldGenerator(config)
+            # Only an explicit config needs a new generator; otherwise reuse the one built at startup
+            if world_config is None:
+                world_generator = self._default_world_generator
+            else:
+                world_generator = WorldGenerator(world_config)
             
-            # Generate world
-            world = world_generator.generate_world()
+            # Generate world (seeded from the controller stream so seeded runs repeat)
+            world = world_generator.generate_world(seed=self.rng.getrandbits(32))
+            self.world_generator = world_generator
             
             # Validate world
             if not world:
@@ -266,13 +319,13 @@ class SimulationController:
             )
         
         # Shuffle locations for random placement
-        random.shuffle(valid_locations)
+        self.rng.shuffle(valid_locations)
         
         # Place animals
         for i, animal in enumerate(animals):
             if i < len(valid_locations):
                 x, y = valid_locations[i]
-                animal.location = (x, y)
+                self.simulation.move_animal(animal, (x, y))
                 
                 # Set animal as occupant of the tile
                 tile = world.get_tile(x, y)
@@ -284,22 +337,11 @@ class SimulationController:
     
     def _get_terrain_stats(self, world: World) -> Dict[str, int]:
         """Get terrain distribution statistics."""
-        stats = {}
-        for x in range(world.dimensions[0]):
-            for y in range(world.dimensions[1]):
-                tile = world.get_tile(x, y)
-                if tile:
-                    terrain = tile.terrain_type.value
-                    stats[terrain] = stats.get(terrain, 0) + 1
-        return stats
+        return dict(Counter(tile._terrain_str for row in world.grid for tile in row if tile))
     
     def _get_category_stats(self, animals: List[Animal]) -> Dict[str, int]:
         """Get animal category distribution statistics."""
-        stats = {}
-        for animal in animals:
-            category = animal.category.value
-            stats[category] = stats.get(category, 0) + 1
-        return stats
+        return dict(Counter(animal._category_str for animal in animals))
     
     def start_simulation(self) -> None:
         """
@@ -347,6 +389,7 @@ class SimulationController:
         self.is_running = False
         self.is_paused = False
         self.simulation_end_time = datetime.now()
+        self.flush_reports()
         
         if self.simulation_start_time:
             duration = self.simulation_end_time - self.simulation_start_time
@@ -358,6 +401,7 @@ class SimulationController:
         """Reset the simulation to initial state."""
         self.stop_simulation()
         self.simulation.reset()
+        self._event_schedules = []
         self.current_generation = 0
         self.generation_stats.clear()
         self.weekly_stats.clear()
@@ -504,22 +548,20 @@ class SimulationController:
         Returns:
             Dictionary containing detailed results of the action resolution.
         """
-        # Initialize the action resolver if not already done
-        if self._action_resolver is None:
-            self._action_resolver = ActionResolver(self.simulation, self.logger)
-        
         # Execute the action resolution system
         return self._action_resolver.execute_action_resolution_system(week)
     
 # GAME LOOP IMPLEMENTATION
 # =============================================================================
 
-    def run_generation(self, max_weeks: Optional[int] = None) -> Dict[str, Any]:
+    def run_generation(self, max_weeks: Optional[int] = None, wait_for_reports: bool = True) -> Dict[str, Any]:
         """
         Run a complete generation of the simulation.
         
         Args:
             max_weeks: Maximum number of weeks to run. If None, uses config value.
+            wait_for_reports: Block until this generation's CSV rows are on disk.
+                run_generations passes False and flushes once after its last generation.
             
         Returns:
             Dictionary containing generation results and statistics.
@@ -527,116 +569,149 @@ class SimulationController:
         Raises:
             ValueError: If simulation is not properly initialized.
         """
-        try:
-            # Validate simulation state
-            if not self.simulation.world:
-                raise ValueError("World must be initialized before running generation")
-            if not self.simulation.population:
-                raise ValueError("Population must be initialized before running generation")
-            
-            max_weeks = max_weeks or self.config.max_weeks
-            
-            self.logger.info("=== STARTING GENERATION ===")
-            self.logger.info(f"Generation {self.current_generation}")
-            self.logger.info(f"Starting population: {len(self.simulation.get_living_animals())} animals")
-            self.logger.info(f"Maximum weeks: {max_weeks}")
-            
-            # Initialize generation tracking
-            generation_start_time = datetime.now()
-            week = 1
+        # Validate simulation state
+        if not self.simulation.world:
+            raise ValueError("World must be initialized before running generation")
+        if not self.simulation.population:
+            raise ValueError("Population must be initialized before running generation")
+        
+        max_weeks = max_weeks or self.config.max_weeks
+        
+        self.logger.info("=== STARTING GENERATION ===")
+        self.logger.info(f"Generation {self.current_generation}")
+        self.logger.info(f"Starting population: {self.simulation.living_count} animals")
+        self.logger.info(f"Maximum weeks: {max_weeks}")
+        
+        # Initialize generation tracking
+        generation_start_time = time.perf_counter()
+        week = 1
+        events_count = 0
+        if self.config.retain_events:
             generation_events = []
+        else:
+            generation_events = deque(maxlen=_EVENT_HISTORY_LIMIT)
+        self._event_schedules = self._build_event_schedules(max_weeks)
+        
+        # Main weekly loop
+        while week <= max_weeks:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("--- WEEK %d ---", week)
             
-            # Main weekly loop
-            while week <= max_weeks:
-                self.logger.info(f"--- WEEK {week} ---")
-                
-                # Run weekly cycle
-                week_result = self._run_weekly_cycle(week)
-                generation_events.extend(week_result.get('events', []))
-                
-                # Check win/loss conditions
-                living_animals = self.simulation.get_living_animals()
-                
-                if len(living_animals) <= 1:
-                    # Generation complete - single survivor or extinction
-                    self.logger.info(f"Generation complete! Survivors: {len(living_animals)}")
-                    break
-                    
-                # Update simulation state
-                self.simulation.current_week = week
-                week += 1
-            
-            # Calculate generation results
-            generation_end_time = datetime.now()
-            generation_duration = generation_end_time - generation_start_time
-            
-            # Final statistics
-            final_living = self.simulation.get_living_animals()
-            final_dead = self.simulation.get_dead_animals()
-            
-            generation_result = {
-                'generation': self.current_generation,
-                'weeks_completed': week - 1,
-                'max_weeks': max_weeks,
-                'survivors': len(final_living),
-                'casualties': len(final_dead),
-                'total_population': len(self.simulation.population),
-                'events_count': len(generation_events),
-                'duration': generation_duration,
-                'winner': final_living[0] if len(final_living) == 1 else None,
-                'extinction': len(final_living) == 0,
-                'events': generation_events
-            }
-            
-            # Log generation completion
-            self.logger.info("=== GENERATION COMPLETE ===")
-            self.logger.info(f"Weeks completed: {week - 1}/{max_weeks}")
-            self.logger.info(f"Final survivors: {len(final_living)}")
-            self.logger.info(f"Total casualties: {len(final_dead)}")
-            self.logger.info(f"Duration: {generation_duration}")
+            # Run weekly cycle
+            week_result = self._run_weekly_cycle(week)
+            week_events = week_result.get('events', [])
+            events_count += len(week_events)
+            generation_events.extend(week_events)
             
-            if generation_result['winner']:
-                self.logger.info(f"Winner: {generation_result['winner'].animal_id}")
-            elif generation_result['extinction']:
-                self.logger.info("Result: EXTINCTION - No survivors")
-            else:
-                self.logger.info("Result: TIME LIMIT REACHED")
+            # Check win/loss conditions
+            living_count = self.simulation.living_count
             
-            # Store generation statistics
-            self.generation_stats.append(generation_result)
+            if living_count <= 1:
+                # Generation complete - single survivor or extinction
+                self.logger.info(f"Generation complete! Survivors: {living_count}")
+                break
+                
+            # Update simulation state
+            self.simulation.current_week = week
+            week += 1
+        
+        # Calculate generation results
+        generation_duration = timedelta(seconds=time.perf_counter() - generation_start_time)
+        
+        # Final statistics
+        final_living = self.simulation.get_living_animals()
+        final_dead = self.simulation.get_dead_animals()
+        
+        generation_result = {
+            'generation': self.current_generation,
+            'weeks_completed': week - 1,
+            'max_weeks': max_weeks,
+            'survivors': len(final_living),
+            'casualties': len(final_dead),
+            'total_population': len(self.simulation.population),
+            'events_count': events_count,
+            'duration': generation_duration,
+            'winner': final_living[0] if len(final_living) == 1 else None,
+            'extinction': len(final_living) == 0,
+            'events': list(generation_events) if not self.config.retain_events else generation_events
+        }
+        
+        # Log generation completion
+        self.logger.info("=== GENERATION COMPLETE ===")
+        self.logger.info(f"Weeks completed: {week - 1}/{max_weeks}")
+        self.logger.info(f"Final survivors: {len(final_living)}")
+        self.logger.info(f"Total casualties: {len(final_dead)}")
+        self.logger.info(f"Duration: {generation_duration}")
+        
+        if generation_result['winner']:
+            self.logger.info(f"Winner: {generation_result['winner'].animal_id}")
+        elif generation_result['extinction']:
+            self.logger.info("Result: EXTINCTION - No survivors")
+        else:
+            self.logger.info("Result: TIME LIMIT REACHED")
+        
+        # Store generation statistics
+        self.generation_stats.append(generation_result)
 
-            # Reporting: write per-animal and per-generation CSVs
-            try:
-                # Get the directory containing this file
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                if current_dir and os.path.exists(current_dir):
-                    out_dir = os.path.join(current_dir, 'demo', 'runs')
-                else:
-                    # Fallback to current working directory
-                    out_dir = os.path.join(os.getcwd(), 'demo', 'runs')
-            except Exception:
-                # Final fallback
-                out_dir = os.path.join(os.getcwd(), 'simulation_data')
-            try:
-                write_population_csv(
-                    os.path.join(out_dir, 'population_summary.csv'),
-                    self.current_generation,
-                    self.simulation.population + self.simulation.graveyard,
-                )
-                summary = compute_generation_summary(self.current_generation, self.simulation.population + self.simulation.graveyard)
-                write_generation_summary_csv(
-                    os.path.join(out_dir, 'generations.csv'),
-                    summary,
-                )
-            except Exception as e:
-                self.logger.warning(f"Reporting write failed: {e}")
-            
-            return generation_result
-            
+        # Reporting: write per-animal and per-generation CSVs
+        out_dir = self.config.output_dir or _OUT_DIR
+        try:
+            # Render rows now (animals are reused next generation), write in the background
+            reported = self.simulation.population + self.simulation.graveyard
+            population_text = format_population_csv(self.current_generation, reported)
+            summary = compute_generation_summary(self.current_generation, reported)
+            self._submit_report(
+                os.path.join(out_dir, 'population_summary.csv'),
+                POPULATION_FIELDNAMES,
+                population_text,
+            )
+            self._submit_report(
+                os.path.join(out_dir, 'generations.csv'),
+                GENERATION_FIELDNAMES,
+                format_generation_summary_csv(summary),
+            )
         except Exception as e:
-            self.logger.error(f"Generation failed: {e}")
-            raise
+            self.logger.warning(f"Reporting write failed: {e}")
+        
+        if wait_for_reports:
+            self.flush_reports()
+        
+        return generation_result
 
+    def _submit_report(self, path: str, fieldnames: List[str], text: str) -> None:
+        """Queue pre-rendered CSV text on the background writer."""
+        future = self._io_executor.submit(append_csv_text, path, fieldnames, text)
+        future.add_done_callback(self._on_report_written)
+    
+    def _on_report_written(self, future: Future) -> None:
+        """Log background write failures (the simulation does not wait on them)."""
+        error = future.exception()
+        if error is not None:
+            self.logger.warning(f"Reporting write failed: {error}")
+    
+    def flush_reports(self) -> None:
+        """Block until every queued CSV write has reached disk."""
+        # The writer is single-threaded, so a no-op completes after all earlier writes
+        try:
+            self._io_executor.submit(lambda: None).result()
+        except RuntimeError:
+            # Already closed; shutdown waited for every queued write
+            pass
+    
+    def close(self) -> None:
+        """Finish queued CSV writes and stop the background writer thread.
+        
+        Safe to call more than once. Reports from later generations are dropped
+        with a warning, so close a controller only once it is done running.
+        """
+        self._io_executor.shutdown(wait=True)
+    
+    def __enter__(self) -> "SimulationController":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
     def evolve_to_next_generation(self) -> List[Animal]:
         """Evolve current population to next generation and reset world/state."""
         parents = self.simulation.get_living_animals() + self.simulation.graveyard
@@ -645,11 +720,16 @@ class SimulationController:
             return []
 
         self.logger.info("Evolving population to next generation...")
-        next_gen = evolve_population(parents)
+        next_gen = evolve_population(parents, self.rng)
 
-        # Regenerate world and reset simulation state
-        self.initialize_world()
+        # Regenerate (or refresh) world and reset simulation state
+        if self.config.fresh_world_each_generation or not self.simulation.world:
+            self.initialize_world()
+        else:
+            self.world_generator.regenerate_resources(self.simulation.world)
+            self.logger.info("World resources refreshed (terrain reused)")
         self.simulation.reset()
+        self._event_schedules = []
 
         # Place new generation
         placed = self._place_animals_in_world(next_gen)
@@ -667,12 +747,72 @@ class SimulationController:
         results: List[Dict[str, Any]] = []
         for g in range(gens):
             self.logger.info(f"==== RUN GENERATION {self.current_generation} ====")
-            result = self.run_generation(max_weeks=weeks_per_generation or self.config.max_weeks)
+            result = self.run_generation(
+                max_weeks=weeks_per_generation or self.config.max_weeks,
+                wait_for_reports=False,
+            )
             results.append(result)
             if g < gens - 1:
                 self.evolve_to_next_generation()
+        self.flush_reports()
         return results
 
+    def run_generations_parallel(
+        self,
+        num_replicates: int,
+        num_generations: Optional[int] = None,
+        weeks_per_generation: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run independent simulation replicates in separate worker processes.
+        
+        Each replicate builds its own controller from this controller's config,
+        seeded with ``base_seed + index``, and runs the usual serial
+        ``run_generations`` chain. Replicates write their CSV reports to a
+        ``replicate_<index>`` subdirectory of the configured output directory,
+        so concurrent workers never append to the same file. A replicate's world, animals, brains and
+        events all derive from its seed, so rerunning with the same config and
+        seed reproduces its results (apart from wall-clock durations). The
+        controller's own simulation state is left untouched; use
+        ``run_generations`` when generations must share it.
+        
+        Args:
+            num_replicates: Number of independent replicates to run.
+            num_generations: Generations per replicate. If None, uses config value.
+            weeks_per_generation: Weeks per generation. If None, uses config value.
+            max_workers: Worker process count. If None, uses os.cpu_count().
+            
+        Returns:
+            One list of generation results per replicate, in replicate order.
+            
+        Raises:
+            ValueError: If num_replicates is not positive.
+        """
+        if num_replicates <= 0:
+            raise ValueError(f"Number of replicates must be positive, got {num_replicates}")
+        
+        base_seed = self.config.random_seed
+        if base_seed is None:
+            base_seed = self.rng.randrange(2 ** 31)
+        seeds = [base_seed + i for i in range(num_replicates)]
+        
+        out_dir = self.config.output_dir or _OUT_DIR
+        
+        self.logger.info(f"Running {num_replicates} replicates in parallel (base seed {base_seed})")
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(
+                    _run_one_replicate,
+                    seed,
+                    replace(self.config, output_dir=os.path.join(out_dir, f"replicate_{i}")),
+                    num_generations,
+                    weeks_per_generation,
+                )
+                for i, seed in enumerate(seeds)
+            ]
+            return [future.result() for future in futures]
+
     # =============================================================================
     # UI SUPPORT: SNAPSHOTS AND STEPPING
     # =============================================================================
@@ -685,29 +825,23 @@ class SimulationController:
         world = self.simulation.world
         if not world:
             return []
-        w, h = world.dimensions
         grid: List[List[Dict[str, Any]]] = []
-        for y in range(h):
+        for tiles in world.grid:
             row: List[Dict[str, Any]] = []
-            for x in range(w):
-                tile = world.get_tile(x, y)
+            append = row.append
+            for tile in tiles:
                 if tile:
-                    resource_type = None
-                    resource_uses = 0
-                    if tile.resource:
-                        resource_type = tile.resource.resource_type.value
-                        resource_uses = getattr(tile.resource, 'uses_left', 0)
-                    occupant_id = tile.occupant.animal_id if tile.occupant else None
-                    occupant_category = tile.occupant.category.value if tile.occupant else None
-                    row.append({
-                        'terrain': tile.terrain_type.value,
-                        'resource_type': resource_type,
-                        'resource_uses': resource_uses,
-                        'occupant_id': occupant_id,
-                        'occupant_category': occupant_category,
+                    resource = tile.resource
+                    occupant = tile.occupant
+                    append({
+                        'terrain': tile._terrain_str,
+                        'resource_type': resource.resource_type.value if resource else None,
+                        'resource_uses': getattr(resource, 'uses_left', 0) if resource else 0,
+                        'occupant_id': occupant.animal_id if occupant else None,
+                        'occupant_category': occupant._category_str if occupant else None,
                     })
                 else:
-                    row.append({'terrain': None, 'resource_type': None, 'resource_uses': 0, 'occupant_id': None, 'occupant_category': None})
+                    append({'terrain': None, 'resource_type': None, 'resource_uses': 0, 'occupant_id': None, 'occupant_category': None})
             grid.append(row)
         return grid
 
@@ -717,19 +851,36 @@ class SimulationController:
         for a in self.simulation.get_living_animals():
             out.append({
                 'animal_id': a.animal_id,
-                'category': a.category.value,
+                'category': a._category_str,
                 'location': a.location,
                 'health': a.status.get('Health', 0),
                 'energy': a.status.get('Energy', 0),
             })
         return out
 
+    def get_population_snapshot_columns(self) -> SimpleNamespace:
+        """
+        Return a columnar snapshot of living animals for UI auto-run.
+        
+        Fields: ids, categories (lists), locs_xy (flat x0, y0, x1, y1, ...),
+        hp and energy (typed arrays); index i describes the same animal in each.
+        """
+        living = self.simulation.get_living_animals()
+        locs_xy = array('i')
+        for a in living:
+            locs_xy.extend(a.location)
+        return SimpleNamespace(
+            ids=[a.animal_id for a in living],
+            categories=[a._category_str for a in living],
+            locs_xy=locs_xy,
+            hp=array('d', [a.status.get('Health', 0) for a in living]),
+            energy=array('d', [a.status.get('Energy', 0) for a in living]),
+        )
+
     def step_decision_status(self, week: int) -> Dict[str, Any]:
         """
         Execute Decision and Status phases only, returning results for visualization.
         """
-        if self._action_resolver is None:
-            self._action_resolver = ActionResolver(self.simulation, self.logger)
         living = self.simulation.get_living_animals()
         actions = self._action_resolver.decision_engine.execute_decision_phase(living)
         status_results = self._action_resolver.status_engine.execute_status_environmental_phase(living)
@@ -741,9 +892,8 @@ class SimulationController:
 
     def step_execution_cleanup(self, planned_actions: List[Any]) -> Dict[str, Any]:
         """Execute Execution and Cleanup phases with provided actions."""
-        if self._action_resolver is None:
-            self._action_resolver = ActionResolver(self.simulation, self.logger)
         exec_results = self._action_resolver.execution_engine.execute_action_execution_phase(planned_actions)
+        self.simulation.invalidate_spatial_index()
         cleanup_results = self._action_resolver.cleanup_engine.execute_cleanup_phase(self.simulation.get_living_animals())
         return {
             'execution_results': exec_results,
@@ -769,34 +919,47 @@ class SimulationController:
         week_events = []
         
         try:
-            self.logger.info(f"Starting week {week}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Starting week %d", week)
             
             # Get event schedule for this week
             event_schedule = self._get_weekly_event_schedule(week)
             
-            # Execute events in order
+            # Execute events in order; checked before each event so a week that
+            # starts (or is left) with at most one animal runs no further events
+            living_count = self.simulation.living_count
             for event_type in event_schedule:
+                if living_count <= 1:
+                    self.logger.info("Early termination: %d animals remaining", living_count)
+                    break
+                
                 event_result = self._execute_event(event_type, week)
                 week_events.append(event_result)
                 
+                # Events may move animals; neighbor queries must see fresh locations
+                self.simulation.invalidate_spatial_index()
+                
                 # Check if any animals died during this event
-                living_count = len(self.simulation.get_living_animals())
-                if living_count <= 1:
-                    self.logger.info(f"Early termination: {living_count} animals remaining")
-                    break
+                living_count = event_result['living_after']
             
             # Week completion
             week_result = {
                 'week': week,
                 'events': week_events,
-                'living_animals': len(self.simulation.get_living_animals()),
+                'events_count': len(week_events),
+                'living_animals': living_count,
                 'dead_animals': len(self.simulation.get_dead_animals())
             }
             
-            self.logger.info(f"Week {week} complete: {week_result['living_animals']} living, {week_result['dead_animals']} dead")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Week %d complete: %d living, %d dead",
+                                 week, week_result['living_animals'], week_result['dead_animals'])
             
-            # Store weekly statistics
-            self.weekly_stats.append(week_result)
+            # Store weekly statistics (event payloads only when they are retained)
+            if self.config.retain_events:
+                self.weekly_stats.append(week_result)
+            else:
+                self.weekly_stats.append({**week_result, 'events': []})
             
             return week_result
             
@@ -816,33 +979,48 @@ class SimulationController:
         Returns:
             List of event types in execution order.
         """
-        if week == 1:
-            # Fixed order for Week 1
-            return [
-                'movement',
-                'triggered_event',
-                'random_event',
-                'disaster',
-                'triggered_event',
-                'movement',
-                'triggered_event'
-            ]
-        else:
-            # Randomized order for subsequent weeks
-            base_events = ['movement', 'triggered_event', 'random_event']
-            
-            # Add disaster with probability
-            if random.random() < 0.3:  # 30% chance of disaster
-                base_events.append('disaster')
-            
-            # Add extra events randomly
-            extra_events = random.choices(['movement', 'triggered_event'], k=random.randint(1, 3))
-            base_events.extend(extra_events)
-            
-            # Shuffle the events
-            random.shuffle(base_events)
+        schedules = self._event_schedules
+        if week > len(schedules):
+            # Outside run_generation (e.g. UI stepping): extend the cached schedule
+            # one week at a time so earlier weeks are never redrawn
+            if not schedules:
+                schedules.append(list(_WEEK1_SCHEDULE))
+            while len(schedules) < week:
+                schedules.append(self._build_random_week_schedule())
+        return schedules[week - 1]
+    
+    def _build_event_schedules(self, max_weeks: int) -> List[List[str]]:
+        """
+        Build the event schedules for a whole generation up front.
+        
+        Week 1 has a fixed order, subsequent weeks are randomized.
+        
+        Args:
+            max_weeks: Number of weeks to schedule.
             
-            return base_events
+        Returns:
+            One list of event types per week, in execution order.
+        """
+        # Fixed order for Week 1, randomized order for subsequent weeks
+        schedules = [list(_WEEK1_SCHEDULE)]
+        schedules.extend(self._build_random_week_schedule() for _ in range(max_weeks - 1))
+        return schedules
+    
+    def _build_random_week_schedule(self) -> List[str]:
+        """Draw one randomized week (any week after the first) from the controller RNG."""
+        rng = self.rng
+        base_events = ['movement', 'triggered_event', 'random_event']
+        
+        # Add disaster with probability
+        if rng.random() < 0.3:  # 30% chance of disaster
+            base_events.append('disaster')
+        
+        # Add extra events randomly
+        base_events.extend(rng.choices(['movement', 'triggered_event'], k=rng.randint(1, 3)))
+        
+        # Shuffle the events
+        rng.shuffle(base_events)
+        return base_events
     
     def _execute_event(self, event_type: str, week: int) -> Dict[str, Any]:
         """
@@ -853,41 +1031,37 @@ class SimulationController:
             week: Current week number.
             
         Returns:
-            Dictionary containing event results.
+            Dictionary containing event results, including 'living_after'
+            (living animal count once the event has resolved).
         """
-        self.logger.debug(f"Executing {event_type} event")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing %s event", event_type)
+        
+        handler = self._event_dispatch.get(event_type)
+        if handler is None:
+            self.logger.warning(f"Unknown event type: {event_type}")
+            event_result = self._failed_event_result(event_type, week, f"Unknown event type: {event_type}")
+        else:
+            try:
+                event_result = handler(week)
+            except Exception as e:
+                self.logger.error(f"Event {event_type} failed: {e}")
+                event_result = self._failed_event_result(event_type, week, str(e))
         
-        event_result = {
+        event_result['living_after'] = self.simulation.living_count
+        return event_result
+    
+    def _failed_event_result(self, event_type: str, week: int, message: str) -> Dict[str, Any]:
+        """Build the result dictionary for an event that could not run."""
+        return {
             'type': event_type,
             'week': week,
-            'timestamp': datetime.now(),
-            'success': True,
-            'message': '',
+            'timestamp': _ts(),
+            'success': False,
+            'message': message,
             'affected_animals': [],
             'casualties': 0
         }
-        
-        try:
-            if event_type == 'movement':
-                event_result = self._execute_movement_event(week)
-            elif event_type == 'triggered_event':
-                event_result = self._execute_triggered_event(week)
-            elif event_type == 'random_event':
-                event_result = self._execute_random_event(week)
-            elif event_type == 'disaster':
-                event_result = self._execute_disaster_event(week)
-            else:
-                self.logger.warning(f"Unknown event type: {event_type}")
-                event_result['success'] = False
-                event_result['message'] = f"Unknown event type: {event_type}"
-            
-            return event_result
-            
-        except Exception as e:
-            self.logger.error(f"Event {event_type} failed: {e}")
-            event_result['success'] = False
-            event_result['message'] = str(e)
-            return event_result
     
     def _execute_movement_event(self, week: int) -> Dict[str, Any]:
         """
@@ -895,7 +1069,8 @@ class SimulationController:
         
         This implements the complete turn-based action processing as specified in Section IV.B.
         """
-        self.logger.info("Executing movement event with Action Resolution System")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Executing movement event with Action Resolution System")
         
         # Execute the complete 4-phase action resolution system
         action_result = self.execute_action_resolution_system(week)
@@ -907,7 +1082,7 @@ class SimulationController:
         return {
             'type': 'movement',
             'week': week,
-            'timestamp': datetime.now(),
+            'timestamp': _ts(),
             'success': action_result['success'],
             'message': f'Movement event with action resolution: {action_result["message"]}',
             'affected_animals': affected_animals,
@@ -920,10 +1095,6 @@ class SimulationController:
     
     def _execute_triggered_event(self, week: int) -> Dict[str, Any]:
         """Execute triggered events using the Event Engine."""
-        # Initialize the event engine if not already done
-        if self._event_engine is None:
-            self._event_engine = EventEngine(self.simulation, self.logger)
-        
         # Execute only triggered events
         event_results = self._event_engine.scheduler.triggered_engine.check_and_execute_events(week)
         
@@ -942,7 +1113,7 @@ class SimulationController:
         return {
             'type': 'triggered_event',
             'week': week,
-            'timestamp': datetime.now(),
+            'timestamp': _ts(),
             'success': True,  # Always successful - no events triggering is normal
             'message': message,
             'affected_animals': affected_animals,
@@ -952,10 +1123,6 @@ class SimulationController:
     
     def _execute_random_event(self, week: int) -> Dict[str, Any]:
         """Execute random events using the Event Engine."""
-        # Initialize the event engine if not already done
-        if self._event_engine is None:
-            self._event_engine = EventEngine(self.simulation, self.logger)
-        
         # Execute only random events
         event_results = self._event_engine.scheduler.random_engine.execute_random_events(week, max_events=1)
         
@@ -974,7 +1141,7 @@ class SimulationController:
         return {
             'type': 'random_event',
             'week': week,
-            'timestamp': datetime.now(),
+            'timestamp': _ts(),
             'success': True,
             'message': message,
             'affected_animals': affected_animals,
@@ -984,10 +1151,6 @@ class SimulationController:
     
     def _execute_disaster_event(self, week: int) -> Dict[str, Any]:
         """Execute disaster events using the Event Engine."""
-        # Initialize the event engine if not already done
-        if self._event_engine is None:
-            self._event_engine = EventEngine(self.simulation, self.logger)
-        
         # Execute only disaster events
         event_results = self._event_engine.scheduler.disaster_engine.execute_disaster_events(week, max_disasters=1)
         
@@ -998,8 +1161,7 @@ class SimulationController:
             affected_animals.extend(result.affected_animals)
         
         # Check if there are no living animals
-        living_animals = self.simulation.get_living_animals()
-        if not living_animals:
+        if not self.simulation.living_count:
             message = "Disaster events: 0 executed - no animals to affect"
         else:
             message = f"Disaster events: {len(event_results)} executed"
@@ -1011,7 +1173,7 @@ class SimulationController:
         return {
             'type': 'disaster',
             'week': week,
-            'timestamp': datetime.now(),
+            'timestamp': _ts(),
             'success': True,
             'message': message,
             'affected_animals': affected_animals,
@@ -1024,6 +1186,44 @@ class SimulationController:
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def timestamp_to_iso(ns: int) -> str:
+    """Convert an event result's 'timestamp' (wall-clock nanoseconds) to an ISO 8601 string."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+def _run_one_replicate(
+    seed: int,
+    config: SimulationConfig,
+    num_generations: Optional[int] = None,
+    weeks_per_generation: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run one independent replicate inside a worker process.
+    
+    Args:
+        seed: Random seed for this replicate.
+        config: Base simulation configuration (the seed is overridden).
+        num_generations: Generations to run. If None, uses config value.
+        weeks_per_generation: Weeks per generation. If None, uses config value.
+        
+    Returns:
+        Picklable generation results: the winner is reduced to its ID and
+        the per-event log is dropped (``events_count`` is kept).
+    """
+    with SimulationController(replace(config, random_seed=seed)) as controller:
+        controller.initialize_world()
+        controller.initialize_population()
+        results = controller.run_generations(num_generations, weeks_per_generation)
+    
+    replicate_results = []
+    for result in results:
+        summary = {k: v for k, v in result.items() if k not in ('winner', 'events')}
+        summary['seed'] = seed
+        summary['winner_id'] = result['winner'].animal_id if result['winner'] else None
+        replicate_results.append(summary)
+    return replicate_results
+
+
 def create_simulation_controller(
     max_weeks: int = 20,
     max_generations: int = 10,
@@ -0,0 +1,5 @@
+"""
+Test Suite for EvoSim
+
+Regression tests for the simulation core (data structures, engines and controller).
+"""
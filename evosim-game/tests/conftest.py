@@ -0,0 +1,34 @@
+"""
+Pytest configuration and shared fixtures for the test suite.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The game modules use flat imports (import constants), so expose the project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_structures import AnimalCategory, Simulation, create_random_animal  # noqa: E402
+from world_generator import GenerationConfig, WorldGenerator  # noqa: E402
+
+
+@pytest.fixture
+def simulation():
+    """Return a simulation over a seeded 25x25 world with no animals."""
+    world = WorldGenerator(GenerationConfig()).generate_world(seed=7)
+    return Simulation(world=world)
+
+
+@pytest.fixture
+def make_animal(simulation):
+    """Return a factory that adds an animal to the simulation at a location."""
+    def _make(animal_id, location, category=AnimalCategory.HERBIVORE):
+        animal = create_random_animal(animal_id, category)
+        simulation.add_animal(animal)
+        simulation.move_animal(animal, location)
+        simulation.world.get_tile(*location).occupant = animal
+        return animal
+    return _make
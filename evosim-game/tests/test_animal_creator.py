@@ -0,0 +1,89 @@
+"""
+Test module for animal creation and custom trait validation.
+"""
+
+import random
+
+import pytest
+
+import constants
+from animal_creator import AnimalCreator, AnimalCustomizer
+from data_structures import AnimalCategory
+
+
+class TestGeneratorThreading:
+    """Test cases for drawing animals from a caller-owned generator."""
+
+    def test_customizer_rng_reaches_brain(self):
+        """Balanced animals drawn from equal generators get identical brains."""
+        brains = []
+        for _ in range(2):
+            customizer = AnimalCustomizer(rng=random.Random(8))
+            animal = customizer.create_balanced_animal("a", AnimalCategory.CARNIVORE)
+            brains.append(animal.mlp_network.get_parameters_flat())
+
+        assert brains[0] == brains[1]
+
+    def test_shared_rng_is_advanced(self):
+        """The customizer draws from the caller's generator rather than a private copy."""
+        rng = random.Random(8)
+        state = rng.getstate()
+        AnimalCustomizer(rng=rng).create_balanced_animal("a", AnimalCategory.OMNIVORE)
+
+        assert rng.getstate() != state
+
+
+class TestCustomTraitValidation:
+    """Test cases for the order in which custom trait errors are reported."""
+
+    def test_invalid_name_reported_first(self):
+        """An unknown trait name wins over missing traits and bad values."""
+        with pytest.raises(ValueError, match="Invalid trait: SPD"):
+            AnimalCreator(seed=1)._validate_custom_traits({"STR": 0, "SPD": 3})
+
+    def test_earlier_bad_value_beats_later_missing_trait(self):
+        """Traits are checked in TRAIT_NAMES order: presence, then value."""
+        with pytest.raises(ValueError, match="Trait STR must be a positive integer"):
+            AnimalCreator(seed=1)._validate_custom_traits({"STR": 0, "AGI": 3})
+
+    def test_earlier_missing_trait_beats_later_bad_value(self):
+        """A missing earlier trait is reported before a later bad value."""
+        with pytest.raises(ValueError, match="Missing required trait: STR"):
+            AnimalCreator(seed=1)._validate_custom_traits({"AGI": 0, "INT": 3, "END": 3, "PER": 3})
+
+    def test_follows_trait_names_replaced_after_import(self, monkeypatch):
+        """Validation reads the current TRAIT_NAMES, as overridden by apply_constants."""
+        creator = AnimalCreator(seed=1)
+        monkeypatch.setattr(constants, "TRAIT_NAMES", ["STR", "AGI", "LCK"])
+
+        creator._validate_custom_traits({"STR": 3, "AGI": 3, "LCK": 3})
+        with pytest.raises(ValueError, match="Invalid trait: INT"):
+            creator._validate_custom_traits({"STR": 3, "AGI": 3, "INT": 3})
+
+
+class TestPopulationAnalysis:
+    """Test cases for the column-oriented population analysis."""
+
+    def test_columns_match_per_animal_analysis(self):
+        """Each column entry equals the per-animal analysis of the same animal."""
+        creator = AnimalCreator(seed=4)
+        animals = creator.create_diverse_population(30, diversity_factor=1.0)
+        animals.append(AnimalCustomizer(seed=4).create_balanced_animal("tie", AnimalCategory.HERBIVORE))
+
+        columns = creator.analyze_population(animals)
+
+        assert all(len(values) == len(animals) for values in columns.values())
+        for i, animal in enumerate(animals):
+            analysis = creator.analyze_animal_traits(animal)
+            assert {key: values[i] for key, values in columns.items()} == \
+                {key: analysis[key] for key in columns}
+        assert len(set(columns["specialization"])) > 1
+
+    def test_empty_population(self):
+        """An empty population yields empty columns."""
+        columns = AnimalCreator(seed=4).analyze_population([])
+
+        assert columns == {
+            "total_traits": [], "primary_trait": [], "primary_value": [],
+            "trait_balance": [], "specialization": [],
+        }
@@ -0,0 +1,117 @@
+"""
+Test module for the Simulation container (living set and spatial index).
+"""
+
+import copy
+import pickle
+import random
+
+from config import SimulationConfig
+from event_engine.random_events import MigrationEvent
+from simulation_controller import SimulationController
+
+
+def _brute_force_neighbors(simulation, pos, radius):
+    """Reference neighbor query that ignores the spatial index."""
+    px, py = pos
+    return {
+        a.animal_id for a in simulation.get_living_animals()
+        if (a.location[0] - px) ** 2 + (a.location[1] - py) ** 2 <= radius * radius
+    }
+
+
+class TestSpatialIndex:
+    """Test cases for Simulation.neighbors_within after animals move."""
+
+    def test_move_animal_updates_neighbors(self, simulation, make_animal):
+        """A moved animal leaves its old neighborhood and joins the new one."""
+        mover = make_animal("mover", (5, 5))
+        make_animal("anchor", (15, 15))
+
+        # Build the index before the move
+        assert [a.animal_id for a in simulation.neighbors_within((5, 5), 1)] == ["mover"]
+
+        simulation.move_animal(mover, (14, 15))
+
+        assert simulation.neighbors_within((5, 5), 1) == []
+        assert {a.animal_id for a in simulation.neighbors_within((15, 15), 1)} == {"mover", "anchor"}
+
+    def test_migration_is_visible_to_neighbor_queries(self, simulation, make_animal):
+        """Locations changed by a migration event are seen without an explicit invalidate."""
+        for i in range(6):
+            make_animal(f"a{i}", (2 + 3 * i, 3))
+
+        # Warm the index on the pre-migration layout
+        simulation.neighbors_within((12, 12), 30)
+
+        random.seed(3)
+        migration = MigrationEvent(
+            event_id="migration",
+            name="Migration",
+            description="Animals migrate to new areas",
+        )
+        result = migration.execute(simulation, week=1)
+        assert result.affected_animals
+
+        for pos in [(x, y) for x in range(0, 25, 4) for y in range(0, 25, 4)]:
+            found = {a.animal_id for a in simulation.neighbors_within(pos, 3)}
+            assert found == _brute_force_neighbors(simulation, pos, 3)
+
+
+class TestLivingSet:
+    """Test cases for the living set as the single source of truth."""
+
+    def test_on_animal_died_updates_every_view(self, simulation, make_animal):
+        """Count, list, membership and neighbor queries agree after a death."""
+        victim = make_animal("victim", (4, 4))
+        make_animal("other", (5, 4))
+        simulation.neighbors_within((4, 4), 2)
+
+        victim.status["Health"] = 0
+        simulation.on_animal_died(victim)
+
+        assert simulation.living_count == len(simulation.get_living_animals()) == 1
+        assert not simulation.is_living(victim)
+        assert [a.animal_id for a in simulation.neighbors_within((4, 4), 2)] == ["other"]
+        assert simulation.graveyard == [victim]
+
+    def test_engines_remove_animals_at_zero_health(self, tmp_path):
+        """After real generations no animal in the living set is at 0 health."""
+        for seed in range(4):
+            config = SimulationConfig(max_weeks=6, population_size=12, random_seed=seed,
+                                      enable_logging=False, output_dir=str(tmp_path))
+            with SimulationController(config) as controller:
+                controller.initialize_world()
+                controller.initialize_population()
+                controller.run_generation()
+                living = controller.simulation.get_living_animals()
+
+                assert controller.simulation.living_count == len(living)
+                assert all(a.status["Health"] > 0 for a in living)
+
+    def test_living_set_survives_deepcopy_and_pickle(self, simulation, make_animal):
+        """Copied simulations track their own animals, not the originals' identities."""
+        make_animal("a", (3, 3))
+        make_animal("b", (6, 6))
+
+        for clone in (copy.deepcopy(simulation), pickle.loads(pickle.dumps(simulation))):
+            first = clone.population[0]
+            assert clone.is_living(first)
+            assert clone.living_count == 2
+            assert {a.animal_id for a in clone.neighbors_within((3, 3), 1)} == {"a"}
+
+            clone.remove_animal(first)
+            assert [a.animal_id for a in clone.population] == ["b"]
+            assert clone.graveyard == [first]
+
+        assert simulation.living_count == 2
+
+    def test_remove_animal_falls_back_to_population_scan(self, simulation, make_animal):
+        """An animal missing from the index is still removed if it is in the population."""
+        animal = make_animal("stray", (2, 2))
+        simulation._living.clear()
+
+        simulation.remove_animal(animal)
+
+        assert simulation.population == []
+        assert simulation.graveyard == [animal]
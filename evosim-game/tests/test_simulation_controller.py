@@ -0,0 +1,208 @@
+"""
+Test module for the SimulationController (seeding and reporting).
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+
+import simulation_controller
+from config import SimulationConfig
+from logging_utils import POPULATION_FIELDNAMES
+from simulation_controller import SimulationController
+
+
+def _small_config(out_dir, **overrides):
+    """Return a quick, quiet config that reports into out_dir."""
+    settings = dict(
+        max_weeks=3,
+        max_generations=2,
+        population_size=6,
+        enable_logging=False,
+        output_dir=str(out_dir),
+    )
+    settings.update(overrides)
+    return SimulationConfig(**settings)
+
+
+def _run_seeded(seed, out_dir):
+    """Run a small seeded simulation to completion (reports are on disk on return)."""
+    with SimulationController(_small_config(out_dir, random_seed=seed)) as controller:
+        controller.initialize_world()
+        controller.initialize_population()
+        controller.run_generations()
+    return controller
+
+
+class TestSeeding:
+    """Test cases for reproducibility under SimulationConfig.random_seed."""
+
+    def test_same_seed_same_world_and_brains(self, tmp_path):
+        """Two controllers with the same seed build identical terrain and brains."""
+        controllers = [SimulationController(_small_config(tmp_path, random_seed=11)) for _ in range(2)]
+        for controller in controllers:
+            controller.initialize_world()
+            controller.initialize_population()
+
+        first, second = controllers
+        assert first.simulation.world.terrain_equals(second.simulation.world)
+        assert [a.location for a in first.simulation.population] == [a.location for a in second.simulation.population]
+        assert [a.mlp_network.get_parameters_flat() for a in first.simulation.population] == \
+            [a.mlp_network.get_parameters_flat() for a in second.simulation.population]
+
+    def test_same_seed_same_population_csv(self, tmp_path):
+        """Two seeded runs write byte-identical population reports."""
+        reports = []
+        for run in ("a", "b"):
+            _run_seeded(5, tmp_path / run)
+            reports.append((tmp_path / run / "population_summary.csv").read_text())
+
+        assert reports[0] == reports[1]
+        assert reports[0].count("\n") > 1
+
+    def test_replicate_is_reproducible(self, tmp_path):
+        """The per-replicate runner gives the same results for the same seed."""
+        config = _small_config(tmp_path)
+
+        def run():
+            results = simulation_controller._run_one_replicate(21, config)
+            return [{k: v for k, v in r.items() if k != "duration"} for r in results]
+
+        assert run() == run()
+
+
+class TestReporting:
+    """Test cases for CSV report placement."""
+
+    def test_parallel_replicates_write_separate_reports(self, tmp_path):
+        """Each replicate appends to its own CSVs, with a single header apiece."""
+        controller = SimulationController(_small_config(tmp_path, random_seed=3))
+        results = controller.run_generations_parallel(2, max_workers=2)
+
+        assert len(results) == 2
+        assert not (tmp_path / "population_summary.csv").exists()
+        header = ",".join(POPULATION_FIELDNAMES)
+        for i in range(2):
+            lines = (tmp_path / f"replicate_{i}" / "population_summary.csv").read_text().splitlines()
+            assert lines.count(header) == 1
+            assert len(lines) > 1
+
+    def test_run_generation_returns_with_reports_written(self, tmp_path):
+        """A single generation's rows are readable as soon as run_generation returns."""
+        controller = SimulationController(_small_config(tmp_path, random_seed=4))
+        controller.initialize_world()
+        controller.initialize_population()
+        controller.run_generation()
+
+        assert (tmp_path / "generations.csv").read_text().count("\n") == 2
+        controller.close()
+
+    def test_close_stops_report_writer(self, tmp_path):
+        """close() joins the background writer thread and tolerates repeat calls."""
+        def writer_threads():
+            return [t for t in threading.enumerate() if t.name.startswith("evosim-report")]
+
+        before = len(writer_threads())
+        controller = SimulationController(_small_config(tmp_path, random_seed=4))
+        controller.initialize_world()
+        controller.initialize_population()
+        controller.run_generation()
+        assert len(writer_threads()) == before + 1
+
+        controller.close()
+        controller.close()
+        controller.flush_reports()
+        assert len(writer_threads()) == before
+
+
+class TestEventSchedule:
+    """Test cases for weekly event schedules outside run_generation."""
+
+    def test_schedule_fallback_extends_once(self, tmp_path):
+        """Weeks requested out of band are drawn once and stay stable."""
+        controller = SimulationController(_small_config(tmp_path, random_seed=9))
+        week3 = controller._get_weekly_event_schedule(3)
+        state = controller.rng.getstate()
+
+        assert controller._get_weekly_event_schedule(3) == week3
+        assert controller._get_weekly_event_schedule(2) == controller._event_schedules[1]
+        assert controller.rng.getstate() == state
+        assert len(controller._event_schedules) == 3
+
+    def test_schedule_fallback_matches_generation_build(self, tmp_path):
+        """Extending week by week draws the same schedules as building them up front."""
+        stepped = SimulationController(_small_config(tmp_path, random_seed=9))
+        built = SimulationController(_small_config(tmp_path, random_seed=9))
+
+        assert [stepped._get_weekly_event_schedule(w) for w in range(1, 6)] == built._build_event_schedules(5)
+
+
+class TestSnapshots:
+    """Test cases for UI snapshot helpers."""
+
+    def test_population_columns_match_row_snapshot(self, tmp_path):
+        """The columnar snapshot carries the same living animals as the row snapshot."""
+        with SimulationController(_small_config(tmp_path, random_seed=6)) as controller:
+            controller.initialize_world()
+            controller.initialize_population()
+            controller.run_generation(max_weeks=2)
+
+            rows = controller.get_population_snapshot()
+            columns = controller.get_population_snapshot_columns()
+            status = controller.get_simulation_status()
+
+        assert len(columns.ids) == status["living_animals"] == len(rows)
+        assert columns.ids == [r["animal_id"] for r in rows]
+        assert columns.categories == [r["category"] for r in rows]
+        assert list(zip(columns.locs_xy[::2], columns.locs_xy[1::2])) == [tuple(r["location"]) for r in rows]
+        assert list(columns.hp) == [r["health"] for r in rows]
+        assert list(columns.energy) == [r["energy"] for r in rows]
+
+    def test_event_results_keep_timestamp_key(self, tmp_path):
+        """Event results stamp 'timestamp' with wall-clock ns that timestamp_to_iso can render."""
+        with SimulationController(_small_config(tmp_path, random_seed=6)) as controller:
+            controller.initialize_world()
+            controller.initialize_population()
+            before = time.time_ns()
+            result = controller.run_generation(max_weeks=1)
+            after = time.time_ns()
+
+        events = list(result["events"])
+        assert events
+        for event in events:
+            assert isinstance(event["timestamp"], int)
+            assert before <= event["timestamp"] <= after
+        iso = simulation_controller.timestamp_to_iso(events[0]["timestamp"])
+        assert datetime.fromisoformat(iso) == datetime.fromtimestamp(events[0]["timestamp"] / 1e9)
+
+
+class TestLogging:
+    """Test cases for the controller logger under enable_logging=False."""
+
+    def test_disabled_logging_keeps_warnings(self, tmp_path, caplog):
+        """Turning logging off drops info chatter and the console handler, not warnings."""
+        controller = SimulationController(_small_config(tmp_path))
+        logger = controller.logger
+
+        with caplog.at_level(logging.DEBUG):
+            logger.info("chatter")
+            logger.warning("careful")
+            logger.error("broken")
+
+        assert not logger.disabled
+        assert not logger.handlers
+        assert logger.level == logging.WARNING
+        assert [r.getMessage() for r in caplog.records if r.name == logger.name] == ["careful", "broken"]
+
+    def test_level_changes_reach_guarded_log_calls(self, tmp_path, caplog):
+        """Hot-path log calls follow logger.setLevel made outside the controller."""
+        with SimulationController(_small_config(tmp_path, random_seed=2)) as controller:
+            controller.initialize_world()
+            controller.initialize_population()
+            controller.logger.setLevel(logging.INFO)
+            with caplog.at_level(logging.DEBUG):
+                controller.run_generation(max_weeks=1)
+
+        messages = [r.getMessage() for r in caplog.records if r.name == controller.logger.name]
+        assert "Starting week 1" in messages
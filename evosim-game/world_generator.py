@@ -18,6 +18,11 @@ from data_structures import (
     create_resource, create_random_animal, AnimalCategory
 )
 
+# 8-connected neighbour offsets, in the order resource placement has always visited them
+_NEIGHBOR_OFFSETS = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)
+)
+
 
 @dataclass
 class GenerationConfig:
@@ -75,6 +80,19 @@ class WorldGenerator:
         
         return world
     
+    def regenerate_resources(self, world: World) -> World:
+        """Clear resources and occupants on an existing world and re-place resources.
+        
+        Terrain is kept as-is, so this is much cheaper than generate_world().
+        """
+        for row in world.grid:
+            for tile in row:
+                tile.resource = None
+                tile.occupant = None
+        
+        self._place_resources(world.grid)
+        return world
+    
     def _generate_terrain_grid(self) -> List[List[TerrainType]]:
         """Generate a 2D grid of terrain types with clustered biomes.
 
@@ -89,13 +107,18 @@ class WorldGenerator:
         grid: List[List[Optional[TerrainType]]] = [[None for _ in range(width)] for _ in range(height)]
 
         # 1) Mountains along the border (if enabled)
-        interior_cells = 0
-        for y in range(height):
-            for x in range(width):
-                if self.config.mountain_border and self._is_border_tile(x, y):
-                    grid[y][x] = TerrainType.MOUNTAINS
-                else:
-                    interior_cells += 1
+        if self.config.mountain_border:
+            # Same test as _is_border_tile, applied per row instead of per cell
+            last_x, last_y = width - 1, height - 1
+            interior_cells = 0
+            for y, row in enumerate(grid):
+                if y == 0 or y == last_y:
+                    row[:] = [TerrainType.MOUNTAINS] * width
+                    continue
+                row[0] = row[last_x] = TerrainType.MOUNTAINS
+                interior_cells += max(0, width - 2)
+        else:
+            interior_cells = width * height
 
         # 2) Determine target counts for interior terrains (excluding Mountains)
         #    We will assign Forest/Jungle/Swamp/Water first; Plains fills the rest.
@@ -176,19 +199,11 @@ class WorldGenerator:
     
     def _create_tiles(self, terrain_grid: List[List[TerrainType]]) -> List[List[Tile]]:
         """Create tile objects from terrain grid."""
-        tiles = []
-        
-        for y in range(self.config.height):
-            row = []
-            for x in range(self.config.width):
-                tile = Tile(
-                    coordinates=(x, y),
-                    terrain_type=terrain_grid[y][x]
-                )
-                row.append(tile)
-            tiles.append(row)
-        
-        return tiles
+        columns = range(self.config.width)
+        return [
+            [Tile(coordinates=(x, y), terrain_type=terrain_row[x]) for x in columns]
+            for y, terrain_row in zip(range(self.config.height), terrain_grid)
+        ]
     
     def _place_resources(self, tiles: List[List[Tile]]) -> None:
         """Place resources on appropriate tiles."""
@@ -200,31 +215,35 @@ class WorldGenerator:
     
     def _place_water_resources(self, tiles: List[List[Tile]]) -> None:
         """Place water resources, clustering them to form lakes and rivers."""
+        width, height = self.config.width, self.config.height
+        water = TerrainType.WATER
+        spawn_chance = self.config.water_spawn_chance
+        rand = self.random.random
+        
         # Find all water terrain tiles
-        water_tiles = []
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                if tiles[y][x].terrain_type == TerrainType.WATER:
-                    water_tiles.append((x, y))
+        water_tiles = [
+            (x, y)
+            for y, row in enumerate(tiles)
+            for x, tile in enumerate(row)
+            if tile.terrain_type is water
+        ]
         
         # Place water resources on water tiles
         for x, y in water_tiles:
-            if self.random.random() < self.config.water_spawn_chance:
-                water_resource = create_resource(ResourceType.WATER, 30, 3)
-                tiles[y][x].resource = water_resource
+            if rand() < spawn_chance:
+                tiles[y][x].resource = create_resource(ResourceType.WATER, 30, 3)
         
         # Also place water resources near water tiles (for drinking)
+        shore_chance = spawn_chance * 0.5
         for x, y in water_tiles:
-            adjacent_tiles = self._get_adjacent_coordinates(x, y)
-            for adj_x, adj_y in adjacent_tiles:
-                if (0 <= adj_x < self.config.width and 
-                    0 <= adj_y < self.config.height and
-                    tiles[adj_y][adj_x].terrain_type != TerrainType.WATER and
-                    tiles[adj_y][adj_x].resource is None):
-                    
-                    if self.random.random() < self.config.water_spawn_chance * 0.5:
-                        water_resource = create_resource(ResourceType.WATER, 20, 2)
-                        tiles[adj_y][adj_x].resource = water_resource
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                adj_x, adj_y = x + dx, y + dy
+                if 0 <= adj_x < width and 0 <= adj_y < height:
+                    adj_tile = tiles[adj_y][adj_x]
+                    if (adj_tile.terrain_type is not water and
+                        adj_tile.resource is None and
+                        rand() < shore_chance):
+                        adj_tile.resource = create_resource(ResourceType.WATER, 20, 2)
     
     def _place_food_resources(self, tiles: List[List[Tile]]) -> None:
         """Place food resources based on terrain type."""
@@ -295,16 +314,6 @@ class WorldGenerator:
         
         return create_resource(resource_type, quantity, uses)
     
-    def _get_adjacent_coordinates(self, x: int, y: int) -> List[Tuple[int, int]]:
-        """Get adjacent coordinates (including diagonals)."""
-        adjacent = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                adjacent.append((x + dx, y + dy))
-        return adjacent
-    
     def place_animals(self, world: World, animals: List[Animal]) -> None:
         """Place animals on valid tiles in the world."""
         # Find all valid spawn locations (plains tiles without occupants)
@@ -340,7 +349,7 @@ class WorldGenerator:
         animal_id = 0
         for category, count in category_counts.items():
             for _ in range(count):
-                animal = create_random_animal(f"gen0_{animal_id:03d}", category)
+                animal = create_random_animal(f"gen0_{animal_id:03d}", category, self.random)
                 animals.append(animal)
                 animal_id += 1
         
@@ -384,7 +393,7 @@ class WorldValidator:
         for y in range(world.dimensions[1]):
             for x in range(world.dimensions[0]):
                 tile = world.get_tile(x, y)
-                terrain = tile.terrain_type.value
+                terrain = tile._terrain_str
                 stats['terrain_counts'][terrain] = stats['terrain_counts'].get(terrain, 0) + 1
                 
                 # Count resources